@@ -5,14 +5,21 @@ AWS Bedrock Knowledge Base APIとの低レベルな通信を担当するクラ
 boto3を使用してAWS APIを呼び出し、エラーハンドリングとロギングを行います。
 """
 
+import copy
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from bedrock_kb_mcp_server.replay import instrument_client
 from bedrock_kb_mcp_server.types import (
     KnowledgeBaseResponseDict,
     DataSourceResponseDict,
@@ -22,10 +29,242 @@ from bedrock_kb_mcp_server.types import (
     S3BucketCreateResponseDict,
     IAMRoleCreateResponseDict,
 )
+# boto3セッションとそのロックは、STSクライアント（get_aws_account_id）と共有するためutilsで定義しています
+from bedrock_kb_mcp_server.utils import (
+    _SESSION,
+    _SESSION_LOCK,
+    TTLCache,
+    get_aws_account_id,
+    get_env_int,
+)
 
 # このモジュール用のロガーを取得
+# ログメッセージはf文字列ではなく%形式の引数で渡し、ログレベルが無効な場合は
+# 文字列の整形自体を行わないようにします（ポーリングなどで高頻度に呼ばれるため）
 logger = logging.getLogger(__name__)
 
+# デフォルトのAWSリージョン
+# 環境変数AWS_REGIONはモジュール読み込み時に1度だけ解決します（デフォルト: us-east-1）
+DEFAULT_REGION = os.getenv("AWS_REGION", "us-east-1")
+
+# ページネーション時の1ページあたりの取得件数
+# 既定値のままだとAPIごとに小さなページサイズが使われ、ページ数分のHTTPSラウンドトリップが発生します
+# 各APIの上限値を明示的に指定することで、大量のリソースがある場合の往復回数を削減します
+_S3_LIST_PAGE_SIZE = 1000  # S3 list_objects_v2の最大値
+_BEDROCK_LIST_PAGE_SIZE = 100  # Bedrock Agent list_* APIの最大値
+
+# S3ドキュメント一覧の並列取得時に使用する最大ワーカー数
+# 共有Configのmax_pool_connections（デフォルト: 50）を超えないように設定します
+_S3_LIST_MAX_WORKERS = 16
+
+# retrieve_manyで同時に実行するクエリ数の上限（デフォルト）
+# 共有Configのmax_pool_connections（デフォルト: 50）を超えないように設定します
+_RETRIEVE_MAX_CONCURRENCY = 8
+
+# get_ingestion_jobs_batchで同時に取得するジョブ数の上限（デフォルト）
+_INGESTION_JOB_BATCH_MAX_CONCURRENCY = 8
+
+# list_data_sources_manyで同時にデータソース一覧を取得するKnowledge Base数の上限（デフォルト）
+_LIST_DATA_SOURCES_MAX_CONCURRENCY = 4
+
+# 取り込みジョブの終了状態
+# これらの状態に達したジョブの情報は変化しないため、期限なしでキャッシュできます
+INGESTION_JOB_TERMINAL_STATES = frozenset({"COMPLETE", "FAILED", "STOPPED"})
+
+# Bedrock Knowledge Base用サービスロールの信頼ポリシー（Trust Policy）のテンプレート
+# Bedrockサービスがロールを引き受けることを許可し、アカウントIDとリージョンで制限します
+# JSON文字列はモジュール読み込み時に1度だけ生成し、呼び出しごとには
+# %(account_id)s / %(region)s のプレースホルダーを置換するだけにします
+_TRUST_POLICY_TEMPLATE = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Service": "bedrock.amazonaws.com"},
+                "Action": "sts:AssumeRole",
+                "Condition": {
+                    "StringEquals": {"aws:SourceAccount": "%(account_id)s"},
+                    "ArnLike": {
+                        "aws:SourceArn": "arn:aws:bedrock:%(region)s:%(account_id)s:knowledge-base/*"
+                    },
+                },
+            }
+        ],
+    }
+)
+
+@lru_cache(maxsize=128)
+def _build_trust_policy_json(account_id: str, role_region: str) -> str:
+    """
+    Bedrock Knowledge Base用サービスロールの信頼ポリシーのJSON文字列を構築します。
+    
+    信頼ポリシーはアカウントIDとリージョンの組み合わせごとに同一のため、
+    結果をキャッシュし、同じ組み合わせでの2回目以降の呼び出しでは文字列を再利用します。
+    
+    Args:
+        account_id: AWSアカウントID
+        role_region: Knowledge Baseを作成するリージョン
+    
+    Returns:
+        str: AssumeRolePolicyDocumentに渡す信頼ポリシーのJSON文字列
+    """
+    # 値はJSON文字列としてエスケープしてから埋め込みます（json.dumpsの結果から前後の引用符を除去）
+    return _TRUST_POLICY_TEMPLATE % {
+        "account_id": json.dumps(account_id)[1:-1],
+        "region": json.dumps(role_region)[1:-1],
+    }
+
+
+# botocoreがサポートするリトライモード
+_RETRY_MODES = ("standard", "adaptive", "legacy")
+
+
+def _get_retry_mode() -> str:
+    """
+    環境変数からリトライモードを取得します。
+    
+    Configにリトライモードを明示すると、botocore自身による環境変数AWS_RETRY_MODEの
+    読み込みは上書きされるため、ここで環境変数を読み込んで反映します。
+    
+    Returns:
+        str: リトライモード（無効な値や未設定の場合は"standard"）
+    """
+    mode = os.getenv("AWS_RETRY_MODE", "standard").strip().lower()
+    if mode not in _RETRY_MODES:
+        logger.warning("Invalid AWS_RETRY_MODE: %s. Using standard.", mode)
+        return "standard"
+    return mode
+
+
+class _RetryGuard:
+    """
+    API（オペレーション）単位のリトライ用トークンバケット
+    
+    プロセス全体で共有され、すべてのクライアントのリトライ送信を制御します。
+    初回の送信はそのまま通し、リトライ（2回目以降の送信）のたびに該当APIの
+    バケットからトークンを1つ消費します。トークンが尽きている場合は、
+    待機せずにThrottlingExceptionのClientErrorを発生させ、リトライを打ち切ります。
+    
+    バケットはAPI名ごとに独立しているため、例えばretrieveがスロットリングされて
+    リトライが集中しても、list_knowledge_basesなど他のAPIのリトライは影響を受けません。
+    各ツールはasyncioの共有スレッドプール（to_thread）で実行されるため、
+    ハンドラー内で待機するとスレッドが占有され、他のツールの実行まで妨げてしまいます。
+    """
+
+    def __init__(self, capacity: float = 10.0, refill_rate: float = 1.0):
+        """
+        トークンバケットを初期化します。
+        
+        Args:
+            capacity: 各APIのバケットの最大トークン数（連続して許可するリトライ数）
+            refill_rate: 1秒あたりに補充されるトークン数
+        """
+        self._capacity = capacity
+        self._refill_rate = refill_rate
+        # API名 -> (残りトークン数, 最終更新時刻)
+        self._buckets: Dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, key: str) -> float:
+        """
+        トークンを1つ取得します。
+        
+        Args:
+            key: バケットのキー（イベント名から取り出したAPI名）
+        
+        Returns:
+            float: 取得できた場合は0、取得できなかった場合は次のトークンまでの待機秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(key, (self._capacity, now))
+            # 経過時間に応じてトークンを補充（最大容量まで）
+            tokens = min(self._capacity, tokens + (now - updated) * self._refill_rate)
+            if tokens >= 1.0:
+                self._buckets[key] = (tokens - 1.0, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (1.0 - tokens) / self._refill_rate
+
+    def acquire_or_raise(
+        self, request: Any = None, event_name: str = "", **kwargs: Any
+    ) -> None:
+        """
+        before-sendイベントのハンドラー。リトライの送信前にトークンを取得します。
+        
+        botocoreは標準/適応リトライモードで、各送信に`amz-sdk-request: attempt=N; max=M`
+        ヘッダー（初回は`attempt=1`のみの場合もあります）を付与します。
+        attempt=1（初回送信）の場合は何もせず、2回目以降の場合のみトークンを消費します。
+        
+        before-sendで発生した例外はbotocoreのリトライ対象にならないため、
+        トークンが尽きている場合はそのままAPI呼び出しの呼び出し元に伝わります。
+        
+        Args:
+            request: 送信されるAWSPreparedRequest
+            event_name: イベント名（例: "before-send.bedrock-agent-runtime.Retrieve"）
+            **kwargs: botocoreから渡されるその他の引数
+        
+        Returns:
+            None: before-sendハンドラーが値を返すと、その値がレスポンスとして
+                  扱われてしまうため、必ずNoneを返します
+        
+        Raises:
+            ClientError: 該当APIのリトライ用トークンが尽きている場合（ThrottlingException）
+        """
+        headers = getattr(request, "headers", None) or {}
+        sdk_request = headers.get("amz-sdk-request", b"")
+        if isinstance(sdk_request, bytes):
+            sdk_request = sdk_request.decode("ascii", "ignore")
+        # 初回送信のヘッダーは"attempt=1"のみの場合もあるため、"; "の前の部分で判定します
+        if not sdk_request or sdk_request.split(";", 1)[0].strip() == "attempt=1":
+            return None
+        
+        # "before-send.<service>.<operation>" のサービス名以降をキーにします
+        key = event_name.split(".", 1)[-1]
+        wait = self._try_acquire(key)
+        if wait > 0:
+            logger.warning("Retry budget exhausted for %s, next token in %.2fs", key, wait)
+            raise ClientError(
+                {
+                    "Error": {
+                        "Code": "ThrottlingException",
+                        "Message": f"Retry budget exhausted for {key}. Retry after {wait:.2f}s",
+                    }
+                },
+                key.rsplit(".", 1)[-1],
+            )
+        return None
+
+
+# プロセス全体で共有するリトライガード
+_RETRY_GUARD = _RetryGuard()
+
+
+def _create_client(service_name: str, **kwargs: Any) -> Any:
+    """
+    共有セッションからboto3クライアントを作成します。
+    
+    作成したクライアントには、リトライ送信を制御する_RetryGuardのハンドラーを登録します。
+    また、環境変数BEDROCK_KB_REPLAY/BEDROCK_KB_RECORDが設定されている場合は、
+    レスポンスの再生・記録の仕組みを設定します（replayモジュールを参照）。
+    
+    Args:
+        service_name: AWSサービス名（例: "bedrock-agent", "s3"）
+        **kwargs: boto3.session.Session.client()に渡す追加引数（region_name, configなど）
+    
+    Returns:
+        boto3クライアント
+    """
+    with _SESSION_LOCK:
+        client = _SESSION.client(service_name, **kwargs)
+    
+    # リトライの送信をプロセス全体で共有するトークンバケットで制御
+    client.meta.events.register("before-send", _RETRY_GUARD.acquire_or_raise)
+    
+    # テスト用の記録・再生モード（環境変数で有効化した場合のみ）
+    return instrument_client(client, service_name)
+
 
 class BedrockKBClient:
     """
@@ -39,10 +278,13 @@ class BedrockKBClient:
         """
         Bedrockクライアントを初期化します。
         
-        環境変数からAWSリージョンを取得し、以下の3つのAWSクライアントを初期化します:
+        環境変数からAWSリージョンを取得し、以下のAWSクライアントの共通設定を準備します:
         - bedrock-agent: Knowledge Baseとデータソースの管理用
         - bedrock-agent-runtime: RAGクエリ実行用
         - s3: S3ドキュメント管理用
+        - iam: IAMロール管理用
+        
+        各クライアントは初回アクセス時に作成されます。
         
         Args:
             region: AWSリージョン（オプション）
@@ -50,60 +292,167 @@ class BedrockKBClient:
         
         Environment Variables:
             AWS_REGION: AWSリージョン（デフォルト: us-east-1）
+            BEDROCK_KB_MAX_POOL_CONNECTIONS: 各クライアントのコネクションプールの最大接続数（デフォルト: 50）
+            AWS_RETRY_MODE: リトライモード（standard, adaptive, legacy、デフォルト: standard）
+            AWS_MAX_ATTEMPTS: 最大試行回数（初回を含む、デフォルト: 5）
         """
         # リージョンを取得（引数 > 環境変数 > デフォルト値の優先順位）
+        # 環境変数はモジュール読み込み時に解決済みのDEFAULT_REGIONを使用します
         # 注意: リージョンはKnowledge Baseの作成時に決定され、後から変更できません
-        self.region = region if region else os.getenv("AWS_REGION", "us-east-1")
+        self.region = region if region else DEFAULT_REGION
         
         # AWSクライアント設定（リトライとタイムアウト設定）
-        # adaptiveモードは、エラーの種類に応じて自動的にリトライ間隔を調整します
+        # standardモードは、ジッター付き指数バックオフで予測可能な間隔でリトライします
         # 一時的なエラー（ThrottlingExceptionなど）に対して自動的にリトライを行います
-        config = Config(
+        # リトライの総量は、プロセス全体で共有する_RetryGuard（API単位のトークンバケット）で制限します
+        # 大量の取り込みジョブなどスループット重視の用途では、環境変数で
+        # AWS_RETRY_MODE=adaptiveに切り替えることもできます
+        # 遅延作成するクライアントでも同じ設定を使用するため、インスタンス属性として保持します
+        self._config = Config(
             retries={
-                'max_attempts': 3,      # 最大3回までリトライ（初回を含む）
-                'mode': 'adaptive'      # 適応的リトライモード（エラーの種類に応じて間隔を調整）
+                'max_attempts': get_env_int("AWS_MAX_ATTEMPTS", 5),  # 最大試行回数（初回を含む、デフォルト: 5）
+                'mode': _get_retry_mode(),  # リトライモード（デフォルト: standard）
             },
             connect_timeout=10,         # 接続タイムアウト: 10秒（サーバーへの接続確立までの最大時間）
-            read_timeout=30             # 読み取りタイムアウト: 30秒（レスポンス受信までの最大時間）
+            read_timeout=30,            # 読み取りタイムアウト: 30秒（レスポンス受信までの最大時間）
+            # コネクションプールの最大接続数（botocoreのデフォルトは10、このサーバーのデフォルトは50）
+            # 並行するツール呼び出しがプールを使い切ると、11本目以降の接続は
+            # 毎回TLSハンドシェイクからやり直しになるため、余裕を持たせます
+            # 環境変数BEDROCK_KB_MAX_POOL_CONNECTIONSで変更できます
+            max_pool_connections=get_env_int("BEDROCK_KB_MAX_POOL_CONNECTIONS", 50),
+            # TCPキープアライブを有効化（ソケットにSO_KEEPALIVEを設定）
+            # ポーリングの合間のアイドル接続がNATやロードバランサーに切断されるのを防ぎ、
+            # 次回呼び出し時のTCP+TLSハンドシェイクを回避します
+            tcp_keepalive=True,
         )
         
-        # Bedrock Agent APIクライアント（Knowledge Base管理用）
-        # このクライアントは、Knowledge Base、データソース、取り込みジョブの
-        # CRUD操作に使用されます
-        self.bedrock_agent = boto3.client(
+        # AWSクライアント（bedrock-agent, bedrock-agent-runtime, s3, iam）は、
+        # それぞれ初回アクセス時に作成します（各プロパティを参照）
+        # retrieveのみ、または管理操作のみを使用するセッションでは、
+        # 使用しないクライアントのサービスモデル読み込みやメモリ確保を省略できます
+        
+        # S3アップロード用の転送設定
+        # Knowledge Baseのソースドキュメント（数十〜数百MBのPDFなど）を想定し、
+        # 16MB未満のファイルはマルチパートを使わず1回のPutObjectで送信し、
+        # それ以上のファイルは16MB単位のパートを最大20並列でアップロードします
+        # 並列数はコネクションプールの最大接続数を超えないようにし、
+        # アップロードスレッドがプールの空きを待ってブロックしないようにします
+        self._upload_cfg = TransferConfig(
+            multipart_threshold=16 * 1024 * 1024,  # マルチパートアップロードに切り替えるサイズ: 16MB
+            multipart_chunksize=16 * 1024 * 1024,  # 各パートのサイズ: 16MB
+            # パートの最大同時アップロード数（最大20、プールの最大接続数以下）
+            max_concurrency=min(20, self._config.max_pool_connections),
+            use_threads=True,  # スレッドを使用して並列アップロード
+        )
+        
+        # 読み取りAPIの結果キャッシュ
+        # ポーリングで繰り返し呼び出されるget系APIのラウンドトリップを削減します
+        # Knowledge Baseのメタデータはほとんど変化しないため、5秒間キャッシュします
+        # キーはKnowledge Base IDです
+        self._kb_cache: TTLCache[str] = TTLCache(maxsize=256, ttl=5)
+        # 取り込みジョブは、実行中は2秒間のみ、終了状態に達した後は期限なしでキャッシュします
+        # キーは(Knowledge Base ID, データソースID, 取り込みジョブID)のタプルです
+        self._ingestion_job_cache: TTLCache[Tuple[str, str, str]] = TTLCache(maxsize=256, ttl=2)
+        # RAGクエリ（retrieve）の結果は、同じ(Knowledge Base ID, クエリ, 結果数)の組み合わせで
+        # 繰り返し実行されることが多いため、一定時間キャッシュします
+        # 件数と有効期限は環境変数で変更でき、BEDROCK_KB_RETRIEVE_CACHE_TTL=0でキャッシュを無効化できます
+        self._retrieve_cache_ttl = get_env_int("BEDROCK_KB_RETRIEVE_CACHE_TTL", 300, min_value=0)
+        # キーは(Knowledge Base ID, クエリ, 結果数)のタプルです
+        self._retrieve_cache: TTLCache[Tuple[str, str, int]] = TTLCache(
+            maxsize=get_env_int("BEDROCK_KB_RETRIEVE_CACHE_SIZE", 1000),
+            ttl=self._retrieve_cache_ttl,
+        )
+        
+        # リージョン情報をログに記録（機密情報はマスクされる）
+        logger.info("Initialized Bedrock client for region: %s", self.region)
+
+    # 注意: cached_propertyはロックを取らないため、複数スレッドから同時に初回アクセスされた場合は
+    # クライアントが重複して作成されることがあります。後から代入された一方が使用され、
+    # もう一方は破棄されるだけなので、動作には影響しません
+
+    @cached_property
+    def bedrock_agent(self) -> Any:
+        """
+        Bedrock Agent APIクライアント（Knowledge Base管理用）を取得します。
+        
+        このクライアントは、Knowledge Base、データソース、取り込みジョブの
+        CRUD操作に使用されます。初回アクセス時に作成し、以降は作成済みのクライアントを返します。
+        
+        Returns:
+            boto3 bedrock-agentクライアント
+        """
+        return _create_client(
             "bedrock-agent",  # AWS Bedrock Agentサービス
             region_name=self.region,  # 指定されたリージョン
-            config=config,  # リトライとタイムアウト設定を適用
+            config=self._config,  # リトライとタイムアウト設定を適用
         )
+
+    @cached_property
+    def bedrock_agent_runtime(self) -> Any:
+        """
+        Bedrock Agent Runtime APIクライアント（RAGクエリ実行用）を取得します。
+        
+        このクライアントは、Knowledge Baseに対するRAGクエリ（retrieve）の実行に使用されます。
+        初回アクセス時に作成し、以降は作成済みのクライアントを返します。
         
-        # Bedrock Agent Runtime APIクライアント（RAGクエリ実行用）
-        # このクライアントは、Knowledge Baseに対するRAGクエリ（retrieve）の
-        # 実行に使用されます
-        self.bedrock_agent_runtime = boto3.client(
+        Returns:
+            boto3 bedrock-agent-runtimeクライアント
+        """
+        return _create_client(
             "bedrock-agent-runtime",  # AWS Bedrock Agent Runtimeサービス
             region_name=self.region,  # 指定されたリージョン
-            config=config,  # リトライとタイムアウト設定を適用
+            config=self._config,  # リトライとタイムアウト設定を適用
         )
+
+    @cached_property
+    def s3_client(self) -> Any:
+        """
+        S3クライアント（ドキュメント管理用）を取得します。
+        
+        このクライアントは、S3バケットへのドキュメントアップロードや
+        ドキュメント一覧の取得に使用されます。初回アクセス時に作成し、以降は作成済みのクライアントを返します。
         
-        # S3クライアント（ドキュメント管理用）
-        # このクライアントは、S3バケットへのドキュメントアップロードや
-        # ドキュメント一覧の取得に使用されます
-        self.s3_client = boto3.client(
+        Returns:
+            boto3 S3クライアント
+        """
+        return _create_client(
             "s3",  # Amazon S3サービス
             region_name=self.region,  # 指定されたリージョン
-            config=config,  # リトライとタイムアウト設定を適用
+            config=self._config,  # リトライとタイムアウト設定を適用
         )
+
+    @cached_property
+    def iam_client(self) -> Any:
+        """
+        IAMクライアント（IAMロール管理用）を取得します。
+        
+        このクライアントは、Bedrock Knowledge Base用のIAMロール作成にのみ使用されるため、
+        初回アクセス時に作成し、以降は作成済みのクライアントを返します。
+        retrieveなどのみを使用する場合は、サービスモデルの読み込みやメモリ確保を省略できます。
+        注意: IAMはグローバルサービスのため、リージョンは指定しません
         
-        # IAMクライアント（IAMロール管理用）
-        # このクライアントは、Bedrock Knowledge Base用のIAMロール作成に使用されます
-        # 注意: IAMはグローバルサービスですが、リージョン指定は無視されます
-        self.iam_client = boto3.client(
+        Returns:
+            boto3 IAMクライアント
+        """
+        return _create_client(
             "iam",  # AWS Identity and Access Managementサービス
-            config=config,  # リトライとタイムアウト設定を適用
+            config=self._config,  # リトライとタイムアウト設定を適用
         )
-        
-        # リージョン情報をログに記録（機密情報はマスクされる）
-        logger.info(f"Initialized Bedrock client for region: {self.region}")
+
+    @cached_property
+    def _kb_paginator(self) -> Any:
+        """list_knowledge_bases用のページネーター（初回アクセス時に作成し、以降は再利用）"""
+        return self.bedrock_agent.get_paginator("list_knowledge_bases")
+
+    @cached_property
+    def _ds_paginator(self) -> Any:
+        """list_data_sources用のページネーター（初回アクセス時に作成し、以降は再利用）"""
+        return self.bedrock_agent.get_paginator("list_data_sources")
+
+    @cached_property
+    def _s3_paginator(self) -> Any:
+        """list_objects_v2用のページネーター（初回アクセス時に作成し、以降は再利用）"""
+        return self.s3_client.get_paginator("list_objects_v2")
 
     def create_knowledge_base(
         self,
@@ -147,34 +496,32 @@ class BedrockKBClient:
             ClientError: AWS API呼び出しが失敗した場合
         """
         try:
-            # API呼び出しパラメータを構築
-            # boto3のcreate_knowledge_baseメソッドに渡すパラメータを辞書形式で構築します
-            api_params = {
-                "name": name,  # Knowledge Baseの名前
-                "description": description,  # Knowledge Baseの説明
-                "roleArn": role_arn,  # IAMロールのARN（Knowledge BaseがAWSサービスにアクセスするために使用）
-                "storageConfiguration": storage_configuration,  # ストレージ設定（S3またはS3_VECTORS）
-            }
-            
-            # Knowledge Base設定が指定されている場合は追加
-            # S3_VECTORSタイプの場合、knowledgeBaseConfigurationが必須です
-            # この設定には、埋め込みモデルのARNが含まれます
-            if knowledge_base_configuration:
-                api_params["knowledgeBaseConfiguration"] = knowledge_base_configuration
-            
-            # ベクトル取り込み設定が指定されている場合は追加
-            # パーシング設定やチャンキング設定を含むことができます
-            if vector_ingestion_configuration:
-                api_params["vectorIngestionConfiguration"] = vector_ingestion_configuration
-            
             # AWS Bedrock APIを呼び出してKnowledge Baseを作成
             # このAPI呼び出しは非同期で実行され、Knowledge Baseの作成が開始されます
             # 作成が完了するまでには時間がかかる場合があります（ステータスで確認可能）
-            response = self.bedrock_agent.create_knowledge_base(**api_params)
+            # 必須パラメータはキーワード引数で直接渡し、オプションの設定は指定されている場合のみ追加します
+            response = self.bedrock_agent.create_knowledge_base(
+                name=name,  # Knowledge Baseの名前
+                description=description,  # Knowledge Baseの説明
+                roleArn=role_arn,  # IAMロールのARN（Knowledge BaseがAWSサービスにアクセスするために使用）
+                storageConfiguration=storage_configuration,  # ストレージ設定（S3またはS3_VECTORS）
+                # Knowledge Base設定（S3_VECTORSタイプの場合は必須、埋め込みモデルのARNを含む）
+                **(
+                    {"knowledgeBaseConfiguration": knowledge_base_configuration}
+                    if knowledge_base_configuration
+                    else {}
+                ),
+                # ベクトル取り込み設定（パーシング設定やチャンキング設定を含むことができます）
+                **(
+                    {"vectorIngestionConfiguration": vector_ingestion_configuration}
+                    if vector_ingestion_configuration
+                    else {}
+                ),
+            )
             
             # 作成成功をログに記録
             # Knowledge BaseのIDをログに記録します（機密情報は自動的にマスクされます）
-            logger.info(f"Created knowledge base: {response['knowledgeBaseId']}")
+            logger.info("Created knowledge base: %s", response['knowledgeBaseId'])
             
             # レスポンスを整形して返す
             # AWS APIのレスポンスから必要な情報を抽出し、統一された形式で返します
@@ -188,7 +535,7 @@ class BedrockKBClient:
             # エラーをログに記録して再発生
             # AWS API呼び出しでエラーが発生した場合、エラー情報をログに記録し、
             # エラーハンドリングデコレータ（handle_errors）が適切に処理できるように再発生させます
-            logger.error(f"Error creating knowledge base: {e}")
+            logger.error("Error creating knowledge base: %s", e)
             raise
 
     def list_knowledge_bases(self) -> List[Dict[str, Any]]:
@@ -210,27 +557,28 @@ class BedrockKBClient:
             ClientError: AWS API呼び出しが失敗した場合
         """
         try:
-            knowledge_bases = []
-            
             # ページネーターを取得（複数ページの結果を自動的に処理）
             # AWS APIはページネーションを使用して結果を返すため、
             # paginatorを使用することで、すべてのページを自動的に処理できます
-            paginator = self.bedrock_agent.get_paginator("list_knowledge_bases")
+            # ページネーターはステートレスなため、作成済みのものを再利用します
+            paginator = self._kb_paginator
             
-            # すべてのページをループして結果を収集
-            # paginate()メソッドは、すべてのページを順番に返すイテレータを返します
-            # 各ページには、knowledgeBaseSummariesというキーにKnowledge Baseのサマリー情報が含まれます
-            for page in paginator.paginate():
-                # 各ページからKnowledge Baseサマリーを取得してリストに追加
-                # ページにknowledgeBaseSummariesキーがない場合（空のページなど）は空リストを返します
-                knowledge_bases.extend(page.get("knowledgeBaseSummaries", []))
+            # すべてのページの結果を1つのレスポンスにまとめる
+            # build_full_result()は、すべてのページを順番に取得し、
+            # 結果キー（knowledgeBaseSummaries）のリストを連結した1つの辞書を返します
+            # 結果が0件の場合はキーが含まれないため、空リストを使用します
+            result = paginator.paginate(
+                PaginationConfig={"PageSize": _BEDROCK_LIST_PAGE_SIZE}
+            ).build_full_result()
+            knowledge_bases: List[Dict[str, Any]] = result.get("knowledgeBaseSummaries", [])
             
             # 取得したKnowledge Baseの数をログに記録
-            logger.info(f"Retrieved {len(knowledge_bases)} knowledge bases")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Retrieved %d knowledge bases", len(knowledge_bases))
             return knowledge_bases
             
         except ClientError as e:
-            logger.error(f"Error listing knowledge bases: {e}")
+            logger.error("Error listing knowledge bases: %s", e)
             raise
 
     def get_knowledge_base(self, knowledge_base_id: str) -> Dict[str, Any]:
@@ -239,6 +587,7 @@ class BedrockKBClient:
         
         Knowledge Baseの設定、ステータス、ストレージ設定などの
         詳細な情報を取得します。
+        取得結果は5秒間キャッシュされ、その間の同じIDへの呼び出しではAPIを呼び出しません。
 
         Args:
             knowledge_base_id: Knowledge BaseのID
@@ -258,6 +607,14 @@ class BedrockKBClient:
         Raises:
             ClientError: AWS API呼び出しが失敗した場合
         """
+        # キャッシュに有効なエントリがあれば、APIを呼び出さずに返す
+        # storageConfigurationなどはネストした辞書のため、
+        # 呼び出し側での変更がキャッシュに影響しないよう、ディープコピーして返します
+        cached: Optional[Dict[str, Any]] = self._kb_cache.get(knowledge_base_id)
+        if cached is not None:
+            logger.debug("Knowledge base cache hit: %s", knowledge_base_id)
+            return copy.deepcopy(cached)
+        
         try:
             # AWS Bedrock APIを呼び出してKnowledge Baseの詳細を取得
             response = self.bedrock_agent.get_knowledge_base(
@@ -265,12 +622,16 @@ class BedrockKBClient:
             )
             
             # 取得成功をログに記録
-            logger.info(f"Retrieved knowledge base: {knowledge_base_id}")
+            logger.info("Retrieved knowledge base: %s", knowledge_base_id)
             
-            # Knowledge Baseの詳細情報を返す
-            return response["knowledgeBase"]
+            # Knowledge Baseの詳細情報をキャッシュして返す
+            # キャッシュにはディープコピーを保存し、
+            # 返した結果が変更されてもキャッシュに影響しないようにします
+            knowledge_base: Dict[str, Any] = response["knowledgeBase"]
+            self._kb_cache.set(knowledge_base_id, copy.deepcopy(knowledge_base))
+            return knowledge_base
         except ClientError as e:
-            logger.error(f"Error getting knowledge base {knowledge_base_id}: {e}")
+            logger.error("Error getting knowledge base %s: %s", knowledge_base_id, e)
             raise
 
     def update_knowledge_base(
@@ -306,22 +667,29 @@ class BedrockKBClient:
             指定する必要があります。
         """
         try:
-            # 更新パラメータを構築（指定されたパラメータのみを含める）
-            update_params = {"knowledgeBaseId": knowledge_base_id}
+            # 更新パラメータを構築（Noneでないパラメータのみを含める）
+            # 空文字列などの値も指定された値として扱い、APIのバリデーションに委ねます
+            update_params = {
+                "knowledgeBaseId": knowledge_base_id,
+                **{
+                    k: v
+                    for k, v in (
+                        ("name", name),
+                        ("description", description),
+                        ("roleArn", role_arn),
+                    )
+                    if v is not None
+                },
+            }
             
-            # 指定されたパラメータを追加
-            if name:
-                update_params["name"] = name
-            if description:
-                update_params["description"] = description
-            if role_arn:
-                update_params["roleArn"] = role_arn
-
             # AWS Bedrock APIを呼び出してKnowledge Baseを更新
             response = self.bedrock_agent.update_knowledge_base(**update_params)
             
             # 更新成功をログに記録
-            logger.info(f"Updated knowledge base: {knowledge_base_id}")
+            logger.info("Updated knowledge base: %s", knowledge_base_id)
+            
+            # 更新前の情報が返されないよう、キャッシュを無効化
+            self._kb_cache.pop(knowledge_base_id)
             
             # 更新結果を整形して返す
             # 更新APIのレスポンスにはarnが含まれない場合があるため、Optionalとして扱います
@@ -331,7 +699,7 @@ class BedrockKBClient:
                 "arn": response["knowledgeBase"].get("knowledgeBaseArn"),  # オプション
             }
         except ClientError as e:
-            logger.error(f"Error updating knowledge base {knowledge_base_id}: {e}")
+            logger.error("Error updating knowledge base %s: %s", knowledge_base_id, e)
             raise
 
     def create_data_source(
@@ -368,24 +736,24 @@ class BedrockKBClient:
             ClientError: AWS API呼び出しが失敗した場合
         """
         try:
-            # API呼び出しパラメータを構築
-            api_params = {
-                "knowledgeBaseId": knowledge_base_id,
-                "name": name,
-                "dataSourceConfiguration": data_source_configuration,
-            }
-            
-            # ベクトル取り込み設定が指定されている場合は追加
-            # パーシング設定やチャンキング設定を含むことができます
-            if vector_ingestion_configuration:
-                api_params["vectorIngestionConfiguration"] = vector_ingestion_configuration
-            
             # AWS Bedrock APIを呼び出してデータソースを作成
-            response = self.bedrock_agent.create_data_source(**api_params)
+            # ベクトル取り込み設定（パーシング設定やチャンキング設定）は指定されている場合のみ追加します
+            response = self.bedrock_agent.create_data_source(
+                knowledgeBaseId=knowledge_base_id,
+                name=name,
+                dataSourceConfiguration=data_source_configuration,
+                **(
+                    {"vectorIngestionConfiguration": vector_ingestion_configuration}
+                    if vector_ingestion_configuration
+                    else {}
+                ),
+            )
             
             # 作成成功をログに記録
             logger.info(
-                f"Created data source {response['dataSource']['id']} for KB {knowledge_base_id}"
+                "Created data source %s for KB %s",
+                response['dataSource']['id'],
+                knowledge_base_id,
             )
             
             # レスポンスを整形して返す
@@ -394,7 +762,7 @@ class BedrockKBClient:
                 "status": response["dataSource"]["status"],
             }
         except ClientError as e:
-            logger.error(f"Error creating data source: {e}")
+            logger.error("Error creating data source: %s", e)
             raise
 
     def list_data_sources(self, knowledge_base_id: str) -> List[Dict[str, Any]]:
@@ -419,23 +787,73 @@ class BedrockKBClient:
             ClientError: AWS API呼び出しが失敗した場合
         """
         try:
-            data_sources = []
-            
             # ページネーターを取得（複数ページの結果を自動的に処理）
-            paginator = self.bedrock_agent.get_paginator("list_data_sources")
+            paginator = self._ds_paginator
             
-            # すべてのページをループして結果を収集
-            for page in paginator.paginate(knowledgeBaseId=knowledge_base_id):
-                # 各ページからデータソースサマリーを取得してリストに追加
-                data_sources.extend(page.get("dataSourceSummaries", []))
+            # すべてのページのデータソースサマリーを連結して1つのリストにまとめる
+            result = paginator.paginate(
+                knowledgeBaseId=knowledge_base_id,
+                PaginationConfig={"PageSize": _BEDROCK_LIST_PAGE_SIZE},
+            ).build_full_result()
+            data_sources: List[Dict[str, Any]] = result.get("dataSourceSummaries", [])
             
             # 取得したデータソースの数をログに記録
-            logger.info(f"Retrieved {len(data_sources)} data sources for KB {knowledge_base_id}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Retrieved %d data sources for KB %s", len(data_sources), knowledge_base_id
+                )
             return data_sources
         except ClientError as e:
-            logger.error(f"Error listing data sources for KB {knowledge_base_id}: {e}")
+            logger.error("Error listing data sources for KB %s: %s", knowledge_base_id, e)
             raise
 
+    def list_data_sources_many(
+        self,
+        knowledge_base_ids: List[str],
+        max_concurrency: int = _LIST_DATA_SOURCES_MAX_CONCURRENCY,
+    ) -> Dict[str, Union[List[Dict[str, Any]], Exception]]:
+        """
+        複数のKnowledge Baseのデータソース一覧を並列に取得します。
+        
+        Bedrock Agentのlist_data_sourcesはnextTokenによるカーソル型のページネーションのため、
+        1つのKnowledge Base内のページを並列に取得することはできません。
+        そのため、Knowledge Baseごとのページネーションをスレッドプールで同時に実行し、
+        複数のKnowledge Baseを対象とする場合の待ち時間を短縮します。
+        
+        Args:
+            knowledge_base_ids: データソース一覧を取得するKnowledge BaseのIDのリスト
+                                （重複したIDは1回だけ取得されます）
+            max_concurrency: 同時に取得する最大Knowledge Base数（デフォルト: 4）
+        
+        Returns:
+            Dict[str, Union[List[Dict[str, Any]], Exception]]: Knowledge Base IDをキーとする辞書
+                取得に成功したKnowledge Baseは`list_data_sources`の戻り値、
+                失敗したKnowledge Baseは発生した例外オブジェクトがそのまま格納されます
+                （一部のKnowledge Baseで失敗しても、他の結果は返されます）
+        """
+        # 入力順を保ったまま重複を除外します
+        unique_ids = list(dict.fromkeys(knowledge_base_ids))
+        if not unique_ids:
+            return {}
+        
+        results: Dict[str, Union[List[Dict[str, Any]], Exception]] = {}
+        workers = max(1, min(max_concurrency, len(unique_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.list_data_sources, kb_id): kb_id for kb_id in unique_ids
+            }
+            # 完了したものから順に結果を格納します
+            for future in as_completed(futures):
+                kb_id = futures[future]
+                try:
+                    results[kb_id] = future.result()
+                except Exception as e:
+                    # Knowledge Base単位の失敗は例外オブジェクトとして返し、呼び出し側で個別に扱えるようにします
+                    results[kb_id] = e
+        
+        # 辞書のキーの順序は入力順に揃えます
+        return {kb_id: results[kb_id] for kb_id in unique_ids}
+
     def start_ingestion_job(
         self, knowledge_base_id: str, data_source_id: str
     ) -> IngestionJobResponseDict:
@@ -470,17 +888,22 @@ class BedrockKBClient:
             
             # ジョブ開始成功をログに記録
             logger.info(
-                f"Started ingestion job {response['ingestionJob']['ingestionJobId']} "
-                f"for data source {data_source_id}"
+                "Started ingestion job %s for data source %s",
+                response['ingestionJob']['ingestionJobId'],
+                data_source_id,
             )
             
+            # 取り込みによりKnowledge Baseの内容が変わるため、このKnowledge BaseのRAGクエリ結果のキャッシュを無効化
+            # （ジョブの完了時にもget_ingestion_jobで改めて無効化します）
+            self._invalidate_retrieve_cache(knowledge_base_id)
+            
             # レスポンスを整形して返す
             return {
                 "ingestion_job_id": response["ingestionJob"]["ingestionJobId"],
                 "status": response["ingestionJob"]["status"],
             }
         except ClientError as e:
-            logger.error(f"Error starting ingestion job: {e}")
+            logger.error("Error starting ingestion job: %s", e)
             raise
 
     def get_ingestion_job(
@@ -491,6 +914,8 @@ class BedrockKBClient:
         
         取り込みジョブの進捗状況、統計情報、エラー情報などを取得できます。
         ジョブの完了を待つために、この関数を定期的に呼び出すことができます。
+        実行中のジョブの結果は2秒間、終了状態（COMPLETE/FAILED/STOPPED）の
+        ジョブの結果は期限なしでキャッシュされます。
 
         Args:
             knowledge_base_id: Knowledge BaseのID
@@ -507,13 +932,25 @@ class BedrockKBClient:
                     - "FAILED": ジョブが失敗
                 - statistics: 統計情報（オプション、ジョブが進行中または完了している場合）
                     - numberOfDocumentsScanned: スキャンされたドキュメント数
-                    - numberOfDocumentsModified: 変更されたドキュメント数
+                    - numberOfMetadataDocumentsScanned: スキャンされたメタデータドキュメント数
+                    - numberOfNewDocumentsIndexed: 新規にインデックスされたドキュメント数
+                    - numberOfModifiedDocumentsIndexed: 変更されてインデックスされたドキュメント数
+                    - numberOfMetadataDocumentsModified: 変更されたメタデータドキュメント数
                     - numberOfDocumentsDeleted: 削除されたドキュメント数
                     - numberOfDocumentsFailed: 失敗したドキュメント数
         
         Raises:
             ClientError: AWS API呼び出しが失敗した場合
         """
+        # キャッシュに有効なエントリがあれば、APIを呼び出さずに返す
+        # statisticsはネストした辞書で、終了状態のジョブは期限なしでキャッシュされるため、
+        # 呼び出し側での変更がキャッシュに影響しないよう、ディープコピーして返します
+        cache_key = (knowledge_base_id, data_source_id, ingestion_job_id)
+        cached: Optional[IngestionJobResponseDict] = self._ingestion_job_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Ingestion job cache hit: %s", ingestion_job_id)
+            return copy.deepcopy(cached)
+        
         try:
             # AWS Bedrock APIを呼び出して取り込みジョブの詳細を取得
             response = self.bedrock_agent.get_ingestion_job(
@@ -523,21 +960,73 @@ class BedrockKBClient:
             )
             
             # 取得成功をログに記録
-            logger.info(f"Retrieved ingestion job {ingestion_job_id}")
+            logger.info("Retrieved ingestion job %s", ingestion_job_id)
             
             # ジョブ情報を抽出
             job = response["ingestionJob"]
             
-            # レスポンスを整形して返す
-            return {
+            # レスポンスを整形
+            result: IngestionJobResponseDict = {
                 "ingestion_job_id": job["ingestionJobId"],
                 "status": job["status"],
                 "statistics": job.get("statistics", {}),  # 統計情報はオプション
             }
+            
+            # 終了状態のジョブは変化しないため期限なし、それ以外は短いTTLでキャッシュ
+            # キャッシュにはディープコピーを保存し、
+            # 返した結果が変更されてもキャッシュに影響しないようにします
+            if job["status"] in INGESTION_JOB_TERMINAL_STATES:
+                self._ingestion_job_cache.set(cache_key, copy.deepcopy(result), ttl=None)
+                # ジョブの実行中にキャッシュされたRAGクエリ結果は、取り込み前の内容の可能性があるため無効化
+                # 終了状態のジョブはキャッシュから返されるため、この処理はジョブごとに1回だけ実行されます
+                if job["status"] == "COMPLETE":
+                    self._invalidate_retrieve_cache(knowledge_base_id)
+            else:
+                self._ingestion_job_cache.set(cache_key, copy.deepcopy(result))
+            return result
         except ClientError as e:
-            logger.error(f"Error getting ingestion job {ingestion_job_id}: {e}")
+            logger.error("Error getting ingestion job %s: %s", ingestion_job_id, e)
             raise
 
+    def get_ingestion_jobs_batch(
+        self,
+        jobs: List[Tuple[str, str, str]],
+        max_concurrency: int = _INGESTION_JOB_BATCH_MAX_CONCURRENCY,
+    ) -> List[Union[IngestionJobResponseDict, Exception]]:
+        """
+        複数の取り込みジョブのステータスを並列に取得します。
+        
+        複数のKnowledge Base・データソースにまたがるジョブをポーリングする際に、
+        各ジョブの`get_ingestion_job`呼び出しをスレッドプールで同時に実行し、
+        1回分のラウンドトリップ程度の時間でまとめて取得します。
+        終了状態のジョブはキャッシュから返されるため、APIは呼び出されません。
+        
+        Args:
+            jobs: 取得するジョブのリスト
+                  各要素は(knowledge_base_id, data_source_id, ingestion_job_id)のタプル
+            max_concurrency: 同時に取得する最大ジョブ数（デフォルト: 8）
+        
+        Returns:
+            List[Union[IngestionJobResponseDict, Exception]]: 各ジョブの結果のリスト（jobsと同じ順序）
+                取得に成功したジョブは`get_ingestion_job`の戻り値、
+                失敗したジョブは発生した例外オブジェクトがそのまま格納されます
+                （一部のジョブが失敗しても、他のジョブの結果は返されます）
+        """
+        if not jobs:
+            return []
+        
+        def _get(job: Tuple[str, str, str]) -> Union[IngestionJobResponseDict, Exception]:
+            try:
+                return self.get_ingestion_job(*job)
+            except Exception as e:
+                # ジョブ単位の失敗は例外オブジェクトとして返し、呼び出し側で個別に扱えるようにします
+                return e
+        
+        workers = max(1, min(max_concurrency, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map()は入力順に結果を返すため、結果はjobsと同じ順序になります
+            return list(executor.map(_get, jobs))
+
     def retrieve(
         self,
         knowledge_base_id: str,
@@ -548,6 +1037,8 @@ class BedrockKBClient:
         Knowledge Baseに対してRAG（Retrieval-Augmented Generation）クエリを実行します。
         
         ベクトル検索を使用して、クエリに関連するドキュメントを取得します。
+        同じ(Knowledge Base ID, クエリ, 結果数)の結果はキャッシュされ、
+        有効期限（デフォルト: 300秒）内はAPIを呼び出さずに返します。
         
         Args:
             knowledge_base_id: クエリ対象のKnowledge BaseのID
@@ -567,6 +1058,16 @@ class BedrockKBClient:
         Raises:
             ClientError: AWS API呼び出しが失敗した場合
         """
+        # キャッシュに有効なエントリがあれば、APIを呼び出さずに返す
+        # 各検索結果はネストした辞書（content、location、metadata）のため、
+        # 呼び出し側での変更がキャッシュに影響しないよう、ディープコピーして返します
+        cache_key = (knowledge_base_id, query, number_of_results)
+        if self._retrieve_cache_ttl > 0:
+            cached: Optional[RetrieveResponseDict] = self._retrieve_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Retrieve cache hit for KB %s", knowledge_base_id)
+                return copy.deepcopy(cached)
+        
         try:
             # Bedrock Agent Runtime APIを使用してRAGクエリを実行
             # retrieve APIは、Knowledge Baseに対してベクトル検索を実行し、
@@ -587,33 +1088,130 @@ class BedrockKBClient:
             # 取得した結果の数をログに記録
             # 検索結果の数をログに記録します（デバッグや監視に有用）
             retrieval_results = response.get("retrievalResults", [])
-            logger.info(f"Retrieved {len(retrieval_results)} results")
+            logger.info("Retrieved %d results", len(retrieval_results))
             
             # レスポンスを整形して返す
             # AWS APIのレスポンスから検索結果を抽出し、クエリテキストと一緒に返します
             # 各結果には、content（テキスト内容）、location（S3 URIなど）、score（関連度）、metadataが含まれます
-            return {
+            result: RetrieveResponseDict = {
                 "results": retrieval_results,  # 検索結果のリスト（関連度順にソート済み）
                 "query": query,  # 実行したクエリテキスト（確認用）
             }
+            # キャッシュにはディープコピーを保存し、
+            # 返した結果が変更されてもキャッシュに影響しないようにします
+            if self._retrieve_cache_ttl > 0:
+                self._retrieve_cache.set(cache_key, copy.deepcopy(result))
+            return result
         except ClientError as e:
-            logger.error(f"Error retrieving from knowledge base: {e}")
+            logger.error("Error retrieving from knowledge base: %s", e)
             raise
 
+    def _invalidate_retrieve_cache(self, knowledge_base_id: str) -> None:
+        """
+        指定したKnowledge BaseのRAGクエリ結果のキャッシュを削除します。
+        
+        Args:
+            knowledge_base_id: キャッシュを無効化するKnowledge BaseのID
+        """
+        # キャッシュキーは(knowledge_base_id, query, number_of_results)のタプルです
+        removed = self._retrieve_cache.pop_matching(lambda key: key[0] == knowledge_base_id)
+        if removed:
+            logger.debug(
+                "Invalidated %d cached retrieve results for KB %s", removed, knowledge_base_id
+            )
+
+    def clear_retrieve_cache(self) -> int:
+        """
+        RAGクエリ（retrieve）の結果キャッシュをすべて削除します。
+        
+        ドキュメントを更新した直後など、キャッシュの有効期限を待たずに
+        最新の検索結果を取得したい場合に使用します。
+        
+        Returns:
+            int: 削除したキャッシュエントリの数
+        """
+        count = len(self._retrieve_cache)
+        self._retrieve_cache.clear()
+        logger.info("Cleared %d cached retrieve results", count)
+        return count
+
+    def retrieve_many(
+        self,
+        knowledge_base_id: str,
+        queries: List[str],
+        number_of_results: int = 5,
+        max_concurrency: int = _RETRIEVE_MAX_CONCURRENCY,
+    ) -> List[RetrieveResponseDict]:
+        """
+        Knowledge Baseに対して複数のRAGクエリを並列に実行します。
+        
+        各クエリの`retrieve`呼び出しをスレッドプールで同時に実行するため、
+        全体の待ち時間は各クエリの待ち時間の合計ではなく、最も遅いクエリの待ち時間に近くなります。
+        
+        Args:
+            knowledge_base_id: クエリ対象のKnowledge BaseのID
+            queries: 検索クエリのテキストのリスト
+            number_of_results: 各クエリで返す結果の数（デフォルト: 5、最大: 100）
+            max_concurrency: 同時に実行する最大クエリ数（デフォルト: 8）
+                              max_pool_connections（デフォルト: 50）以下の値を指定してください
+        
+        Returns:
+            List[RetrieveResponseDict]: 各クエリの結果のリスト（queriesと同じ順序）
+                各要素の形式は`retrieve`の戻り値と同じです
+        
+        Raises:
+            ClientError: いずれかのクエリのAWS API呼び出しが失敗した場合
+        """
+        if not queries:
+            return []
+        
+        workers = max(1, min(max_concurrency, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map()は入力順に結果を返すため、結果はqueriesと同じ順序になります
+            results = list(
+                executor.map(
+                    lambda q: self.retrieve(knowledge_base_id, q, number_of_results),
+                    queries,
+                )
+            )
+        
+        logger.info(
+            "Retrieved results for %d queries from KB %s", len(results), knowledge_base_id
+        )
+        return results
+
     def upload_document_to_s3(
-        self, local_file_path: str, bucket_name: str, s3_key: str
+        self,
+        local_file_path: str,
+        bucket_name: str,
+        s3_key: str,
+        file_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        part_size: Optional[int] = None,
     ) -> S3UploadResponseDict:
         """
         ローカルファイルをS3バケットにアップロードします。
         
         アップロードされたファイルは、Knowledge Baseのデータソースとして
         使用できます。
+        
+        file_sizeが指定され、マルチパートアップロードの閾値（16MB）未満の場合は、
+        put_objectによる1回のリクエストでアップロードします
+        （転送マネージャーのスレッド起動やファイルサイズの再取得を省略します）。
+        それ以外の場合は、upload_fileによるマルチパート対応のアップロードを使用します。
 
         Args:
             local_file_path: アップロードするローカルファイルのパス
             bucket_name: アップロード先のS3バケット名
             s3_key: S3オブジェクトキー（バケット内のパス）
                     例: "documents/myfile.pdf" のようにパスを指定可能
+            file_size: ファイルサイズ（バイト、オプション）
+                       呼び出し側でos.stat()済みの場合に指定すると、アップロード方法の選択に使用します
+            max_concurrency: マルチパートアップロードでパートを同時に送信する最大数（オプション）
+                             省略した場合は共有の転送設定（最大20）を使用します
+            part_size: マルチパートアップロードの各パートのサイズ（バイト、オプション）
+                       省略した場合は共有の転送設定（16MB）を使用します
+                       この値はマルチパートに切り替えるファイルサイズの閾値としても使用されます
 
         Returns:
             S3UploadResponseDict: アップロード結果
@@ -625,19 +1223,113 @@ class BedrockKBClient:
                 例: バケットが存在しない、権限がない、ファイルが大きすぎるなど
         """
         try:
-            # S3クライアントを使用してファイルをアップロード
-            self.s3_client.upload_file(local_file_path, bucket_name, s3_key)
+            upload_cfg = self._get_upload_config(max_concurrency, part_size)
+            if file_size is not None and file_size < upload_cfg.multipart_threshold:
+                # 小さなファイルは1回のPUTでアップロードします
+                with open(local_file_path, "rb") as body:
+                    self.s3_client.put_object(
+                        Bucket=bucket_name,
+                        Key=s3_key,
+                        Body=body,
+                        ContentLength=file_size,
+                    )
+            else:
+                # S3クライアントを使用してファイルをアップロード
+                # 大きなファイルはTransferConfigに従ってマルチパートで並列アップロードされます
+                # boto3の転送マネージャーは、完了したパートから順に次のパートの送信を開始するため、
+                # 一部の遅いパートが他のパートの送信を待たせることはありません
+                self.s3_client.upload_file(
+                    local_file_path, bucket_name, s3_key, Config=upload_cfg
+                )
             
             # S3 URIを構築
             s3_uri = f"s3://{bucket_name}/{s3_key}"
             
             # アップロード成功をログに記録
-            logger.info(f"Uploaded document to {s3_uri}")
+            logger.info("Uploaded document to %s", s3_uri)
             
             # アップロード結果を返す
             return {"s3_uri": s3_uri, "status": "uploaded"}
         except ClientError as e:
-            logger.error(f"Error uploading document to S3: {e}")
+            logger.error("Error uploading document to S3: %s", e)
+            raise
+
+    def _get_upload_config(
+        self, max_concurrency: Optional[int], part_size: Optional[int]
+    ) -> TransferConfig:
+        """
+        アップロードに使用する転送設定を取得します。
+        
+        並列数とパートサイズのどちらも指定されていない場合は、共有の転送設定をそのまま返します。
+        指定された場合は、その呼び出し専用の転送設定を作成します。
+        
+        Args:
+            max_concurrency: パートを同時に送信する最大数（Noneの場合は共有設定の値）
+            part_size: 各パートのサイズ（バイト、Noneの場合は共有設定の値）
+        
+        Returns:
+            TransferConfig: アップロードに使用する転送設定
+        """
+        if max_concurrency is None and part_size is None:
+            return self._upload_cfg
+        
+        chunksize = part_size or self._upload_cfg.multipart_chunksize
+        return TransferConfig(
+            multipart_threshold=chunksize,
+            multipart_chunksize=chunksize,
+            # 並列数はコネクションプールの最大接続数を超えないようにします
+            max_concurrency=min(
+                max_concurrency or self._upload_cfg.max_concurrency,
+                self._config.max_pool_connections,
+            ),
+            use_threads=True,
+        )
+
+    def iter_s3_documents(
+        self, bucket_name: str, prefix: str = ""
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        S3バケット内のドキュメントを1件ずつ返すイテレータを取得します。
+        
+        ページネーションを使用して、ページを取得するたびにドキュメント情報を
+        逐次生成します。一覧全体をメモリ上に保持しないため、大量のオブジェクトを
+        含むバケットでも、呼び出し側でストリーム処理できます。
+
+        Args:
+            bucket_name: S3バケット名
+            prefix: フィルタリングするS3プレフィックス（オプション）
+
+        Yields:
+            Dict[str, Any]: ドキュメントの詳細情報
+                - key: S3オブジェクトキー（ファイルパス）
+                - size: ファイルサイズ（バイト）
+                - last_modified: 最終更新日時（datetime）
+        
+        Raises:
+            ClientError: AWS API呼び出しが失敗した場合（イテレーション中に発生）
+        """
+        try:
+            # ページネーターを取得（複数ページの結果を自動的に処理）
+            paginator = self._s3_paginator
+            
+            # 各ページのオブジェクト情報を整形して逐次返す
+            # ページにContentsキーがない場合（空のプレフィックスなど）は空タプルを使用します
+            yield from (
+                {
+                    "key": obj["Key"],  # S3オブジェクトキー
+                    "size": obj["Size"],  # ファイルサイズ（バイト）
+                    # 最終更新日時（datetimeのまま返し、文字列への変換はシリアライズ時に行う）
+                    "last_modified": obj["LastModified"],
+                }
+                for page in paginator.paginate(
+                    Bucket=bucket_name,
+                    Prefix=prefix,
+                    PaginationConfig={"PageSize": _S3_LIST_PAGE_SIZE},
+                )
+                for obj in page.get("Contents", ())
+            )
+        except ClientError as e:
+            logger.error("Error listing S3 documents: %s", e)
             raise
 
     def list_s3_documents(
@@ -649,6 +1341,9 @@ class BedrockKBClient:
         ページネーションを使用して、すべてのドキュメントを取得します。
         指定されたプレフィックス（フォルダ）に一致するドキュメントのみを
         取得することもできます。
+        
+        内部的には`iter_s3_documents`の結果をリストに変換します。
+        大量のドキュメントを逐次処理する場合は`iter_s3_documents`を使用してください。
 
         Args:
             bucket_name: S3バケット名
@@ -661,7 +1356,7 @@ class BedrockKBClient:
                 各要素には以下の情報が含まれます:
                 - key: S3オブジェクトキー（ファイルパス）
                 - size: ファイルサイズ（バイト）
-                - last_modified: 最終更新日時（ISO形式）
+                - last_modified: 最終更新日時（datetime）
         
         Raises:
             ClientError: AWS API呼び出しが失敗した場合
@@ -670,30 +1365,171 @@ class BedrockKBClient:
         Note:
             大量のドキュメントがある場合、この関数の実行に時間がかかる場合があります。
         """
+        documents = list(self.iter_s3_documents(bucket_name, prefix))
+        
+        # 取得したドキュメントの数をログに記録
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Retrieved %d documents from S3", len(documents))
+        return documents
+
+    def list_s3_documents_page(
+        self,
+        bucket_name: str,
+        prefix: str = "",
+        max_results: int = _S3_LIST_PAGE_SIZE,
+        continuation_token: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        S3バケット内のドキュメント一覧を、指定した件数ずつ取得します。
+        
+        一覧全体ではなく最大max_results件だけを取得し、続きを取得するためのトークンを返します。
+        大量のオブジェクトを含むバケットでも、1回の呼び出しで保持するデータ量と待ち時間が
+        max_resultsに比例する範囲に収まります。
+        
+        Args:
+            bucket_name: S3バケット名
+            prefix: フィルタリングするS3プレフィックス（オプション）
+            max_results: 取得する最大ドキュメント数（デフォルト: 1000）
+            continuation_token: 前回の呼び出しで返されたトークン（続きから取得する場合）
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: ドキュメントのリストと、続きを取得するためのトークン
+                ドキュメントの形式は`iter_s3_documents`と同じです
+                すべてのドキュメントを取得し終えた場合、トークンはNoneです
+        
+        Raises:
+            ClientError: AWS API呼び出しが失敗した場合
+        """
+        pagination_config: Dict[str, Any] = {
+            "MaxItems": max_results,
+            # 必要な件数以上をページで取得しないよう、ページサイズもmax_results以下にします
+            "PageSize": min(max_results, _S3_LIST_PAGE_SIZE),
+        }
+        if continuation_token:
+            pagination_config["StartingToken"] = continuation_token
+        
+        try:
+            # MaxItemsに達した時点でページネーションが止まり、続きのトークンがNextTokenに格納されます
+            result = self._s3_paginator.paginate(
+                Bucket=bucket_name,
+                Prefix=prefix,
+                PaginationConfig=pagination_config,
+            ).build_full_result()
+        except ClientError as e:
+            logger.error("Error listing S3 documents: %s", e)
+            raise
+        
+        documents = [
+            {
+                "key": obj["Key"],  # S3オブジェクトキー
+                "size": obj["Size"],  # ファイルサイズ（バイト）
+                "last_modified": obj["LastModified"],  # 最終更新日時（datetime）
+            }
+            for obj in result.get("Contents", ())
+        ]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Retrieved %d documents from S3", len(documents))
+        return documents, result.get("NextToken")
+
+    def _discover_s3_prefixes(
+        self, bucket_name: str, prefix: str = ""
+    ) -> tuple[List[str], List[Dict[str, Any]]]:
+        """
+        指定したプレフィックス直下の「フォルダ」（CommonPrefixes）を検出します。
+        
+        Delimiter="/"を指定してlist_objects_v2を呼び出し、1階層下のプレフィックスと、
+        プレフィックス直下に直接置かれているドキュメントを分けて取得します。
+        
+        Args:
+            bucket_name: S3バケット名
+            prefix: 検出の起点となるS3プレフィックス（オプション）
+        
+        Returns:
+            tuple[List[str], List[Dict[str, Any]]]:
+                - 1階層下のプレフィックスのリスト
+                - プレフィックス直下のドキュメントの詳細情報のリスト
+        
+        Raises:
+            ClientError: AWS API呼び出しが失敗した場合
+        """
+        sub_prefixes: List[str] = []
+        documents: List[Dict[str, Any]] = []
+        paginator = self._s3_paginator
+        for page in paginator.paginate(
+            Bucket=bucket_name,
+            Prefix=prefix,
+            Delimiter="/",
+            PaginationConfig={"PageSize": _S3_LIST_PAGE_SIZE},
+        ):
+            sub_prefixes.extend(p["Prefix"] for p in page.get("CommonPrefixes", ()))
+            documents.extend(
+                {
+                    "key": obj["Key"],
+                    "size": obj["Size"],
+                    "last_modified": obj["LastModified"],
+                }
+                for obj in page.get("Contents", ())
+            )
+        return sub_prefixes, documents
+
+    def list_s3_documents_parallel(
+        self,
+        bucket_name: str,
+        prefixes: Optional[List[str]] = None,
+        prefix: str = "",
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        S3バケット内のドキュメント一覧を、プレフィックスごとに並列で取得します。
+        
+        list_objects_v2はContinuationTokenを順番にたどる必要があるため、
+        1つのプレフィックスの一覧取得は逐次処理になります。
+        この関数では、一覧をプレフィックス単位のシャードに分割し、
+        各シャードのページネーションをスレッドプールで同時に実行します。
+        
+        prefixesを指定しない場合は、prefix直下の「フォルダ」（CommonPrefixes）を
+        自動的に検出してシャードとして使用します。
+
+        Args:
+            bucket_name: S3バケット名
+            prefixes: 並列に一覧取得するS3プレフィックスのリスト（オプション）
+                      指定した場合、各プレフィックスの結果をまとめて返します
+                      （プレフィックス同士が重複しないように指定してください）
+            prefix: 自動シャーディングの起点となるS3プレフィックス（オプション）
+                    prefixesを指定しない場合のみ使用されます
+            max_workers: 最大並列数（オプション、デフォルト: 16）
+
+        Returns:
+            List[Dict[str, Any]]: ドキュメントの詳細情報のリスト
+                （list_s3_documentsと同じ形式。順序はシャードごとのキー順）
+        
+        Raises:
+            ClientError: AWS API呼び出しが失敗した場合
+        """
         try:
-            documents = []
+            documents: List[Dict[str, Any]] = []
+            if prefixes is None:
+                # 1階層下のプレフィックスを検出し、直下のドキュメントは先に結果へ追加
+                prefixes, documents = self._discover_s3_prefixes(bucket_name, prefix)
             
-            # ページネーターを取得（複数ページの結果を自動的に処理）
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            
-            # すべてのページをループして結果を収集
-            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
-                # 各ページからオブジェクト情報を取得
-                for obj in page.get("Contents", []):
-                    # ドキュメント情報を整形してリストに追加
-                    documents.append(
-                        {
-                            "key": obj["Key"],  # S3オブジェクトキー
-                            "size": obj["Size"],  # ファイルサイズ（バイト）
-                            "last_modified": obj["LastModified"].isoformat(),  # ISO形式の日時
-                        }
-                    )
+            if prefixes:
+                workers = min(max_workers or _S3_LIST_MAX_WORKERS, len(prefixes))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # map()は入力順に結果を返すため、結果の順序は決定的になります
+                    for shard in executor.map(
+                        lambda p: self.list_s3_documents(bucket_name, p), prefixes
+                    ):
+                        documents.extend(shard)
             
-            # 取得したドキュメントの数をログに記録
-            logger.info(f"Retrieved {len(documents)} documents from S3")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Retrieved %d documents from S3 using %d parallel shards",
+                    len(documents),
+                    len(prefixes),
+                )
             return documents
         except ClientError as e:
-            logger.error(f"Error listing S3 documents: {e}")
+            logger.error("Error listing S3 documents in parallel: %s", e)
             raise
 
     def create_s3_bucket(
@@ -768,7 +1604,7 @@ class BedrockKBClient:
             bucket_arn = f"arn:aws:s3:::{bucket_name}"
             
             # バケット作成成功をログに記録
-            logger.info(f"Created S3 bucket: {bucket_name} in region: {bucket_region}")
+            logger.info("Created S3 bucket: %s in region: %s", bucket_name, bucket_region)
             
             # 作成結果を返す
             return {
@@ -778,7 +1614,7 @@ class BedrockKBClient:
                 "status": "created",
             }
         except ClientError as e:
-            logger.error(f"Error creating S3 bucket: {e}")
+            logger.error("Error creating S3 bucket: %s", e)
             raise
 
     def create_bedrock_kb_role(
@@ -820,9 +1656,6 @@ class BedrockKBClient:
             - ロールは /service-role/ パスに作成されます
             - 信頼ポリシーには、現在のAWSアカウントIDとリージョンが自動的に設定されます
         """
-        import json
-        from bedrock_kb_mcp_server.utils import get_aws_account_id
-        
         try:
             # リージョンを使用（既定値はus-east-1）
             role_region = region
@@ -830,34 +1663,15 @@ class BedrockKBClient:
             # AWSアカウントIDを取得
             account_id = get_aws_account_id()
             
-            # 信頼ポリシー（Trust Policy）を構築
-            # Bedrockサービスがこのロールを引き受けることを許可します
-            trust_policy = {
-                "Version": "2012-10-17",
-                "Statement": [
-                    {
-                        "Effect": "Allow",
-                        "Principal": {
-                            "Service": "bedrock.amazonaws.com"
-                        },
-                        "Action": "sts:AssumeRole",
-                        "Condition": {
-                            "StringEquals": {
-                                "aws:SourceAccount": account_id
-                            },
-                            "ArnLike": {
-                                "aws:SourceArn": f"arn:aws:bedrock:{role_region}:{account_id}:knowledge-base/*"
-                            }
-                        }
-                    }
-                ]
-            }
+            # 信頼ポリシー（Trust Policy）のJSON文字列を取得
+            # 同じアカウントID・リージョンの組み合わせでは、キャッシュ済みの文字列を再利用します
+            trust_policy_json = _build_trust_policy_json(account_id, role_region)
             
             # IAMロールを作成
             # パス /service-role/ を使用して、サービスロールとして識別しやすくします
             response = self.iam_client.create_role(
                 RoleName=role_name,
-                AssumeRolePolicyDocument=json.dumps(trust_policy),
+                AssumeRolePolicyDocument=trust_policy_json,
                 Path="/service-role/",
                 Description=description,
                 MaxSessionDuration=max_session_duration,
@@ -867,7 +1681,7 @@ class BedrockKBClient:
             role_arn = response["Role"]["Arn"]
             
             # ロール作成成功をログに記録
-            logger.info(f"Created IAM role: {role_name} (ARN: {role_arn})")
+            logger.info("Created IAM role: %s (ARN: %s)", role_name, role_arn)
             
             # 作成結果を返す
             return {
@@ -877,6 +1691,116 @@ class BedrockKBClient:
                 "status": "created",
             }
         except ClientError as e:
-            logger.error(f"Error creating IAM role: {e}")
+            logger.error("Error creating IAM role: %s", e)
             raise
 
+
+# プロセス全体で共有するデフォルトのBedrockKBClientインスタンス
+# get_default_client()の初回呼び出し時に作成されます
+_DEFAULT_CLIENT: Optional[BedrockKBClient] = None
+
+# デフォルトクライアント（およびリージョンごとのクライアント）の作成を保護するロック
+# 複数のスレッドから同時に初回呼び出しが行われても、インスタンスが1つだけ作成されるようにします
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+
+
+def get_default_client() -> BedrockKBClient:
+    """
+    プロセス全体で共有するデフォルトのBedrockKBClientを取得します。
+    
+    初回呼び出し時にインスタンスを作成し、以降は同じインスタンスを返します。
+    BedrockKBClientの作成にはboto3クライアントの初期化（サービスモデルの読み込み、
+    エンドポイント解決など）が伴うため、リクエストごとに作成せずにこの関数を使用してください。
+    
+    Returns:
+        BedrockKBClient: 環境変数AWS_REGIONのリージョン（デフォルト: us-east-1）を使用するクライアント
+    """
+    global _DEFAULT_CLIENT
+    
+    # 作成済みの場合はロックを取得せずに返す（高速パス）
+    client = _DEFAULT_CLIENT
+    if client is not None:
+        return client
+    
+    with _DEFAULT_CLIENT_LOCK:
+        # ロック待ちの間に他のスレッドが作成している可能性があるため、再度確認します
+        if _DEFAULT_CLIENT is None:
+            _DEFAULT_CLIENT = BedrockKBClient()
+        return _DEFAULT_CLIENT
+
+
+# リージョンごとに共有するBedrockKBClientインスタンス（リージョン名 -> クライアント）
+# デフォルトリージョン以外のリージョンを指定した呼び出しで使用します
+_REGIONAL_CLIENTS: Dict[str, BedrockKBClient] = {}
+
+
+def get_regional_client(region: str) -> BedrockKBClient:
+    """
+    指定したリージョン用の共有BedrockKBClientを取得します。
+    
+    リージョンごとに1つのインスタンスを作成してキャッシュし、以降は同じインスタンスを返します。
+    デフォルトリージョン（環境変数AWS_REGION）と同じリージョンの場合は、
+    get_default_client()と同じインスタンスを返します。
+    
+    Args:
+        region: AWSリージョン（例: "us-east-1", "ap-northeast-1"）
+    
+    Returns:
+        BedrockKBClient: 指定したリージョンを使用するクライアント
+    """
+    if region == DEFAULT_REGION:
+        return get_default_client()
+    
+    # 作成済みの場合はロックを取得せずに返す（高速パス）
+    client = _REGIONAL_CLIENTS.get(region)
+    if client is not None:
+        return client
+    
+    with _DEFAULT_CLIENT_LOCK:
+        # ロック待ちの間に他のスレッドが作成している可能性があるため、再度確認します
+        client = _REGIONAL_CLIENTS.get(region)
+        if client is None:
+            client = BedrockKBClient(region=region)
+            _REGIONAL_CLIENTS[region] = client
+        return client
+
+
+def _warm_up_default_client() -> None:
+    """
+    デフォルトクライアントと、よく使用するboto3クライアントを事前に作成します。
+
+    warm_up_default_client()から起動されるバックグラウンドスレッドで実行されます。
+    ウォームアップは最適化のためだけに行うため、失敗してもログに記録するだけで例外は送出しません
+    （実際のツール呼び出し時に改めてクライアントが作成され、エラーはそこで報告されます）。
+    """
+    try:
+        client = get_default_client()
+        # サービスモデルの読み込みと認証情報の解決は初回のクライアント作成時に行われるため、
+        # ツール呼び出しで最も使用されるBedrock関連のクライアントを先に作成しておきます
+        client.bedrock_agent
+        client.bedrock_agent_runtime
+        logger.debug("Default Bedrock KB client warmed up for region %s", client.region)
+    except Exception as e:
+        logger.debug("Default Bedrock KB client warm-up failed: %s", e)
+
+
+def warm_up_default_client() -> threading.Thread:
+    """
+    デフォルトクライアントの作成をバックグラウンドスレッドで開始します。
+
+    boto3クライアントの初期化（サービスモデルの読み込み、認証情報の解決など）には
+    数百ミリ秒かかることがあるため、MCPサーバーの起動処理（initializeへの応答）を
+    ブロックしないよう、別スレッドで先に実行しておきます。
+    最初のツール呼び出しがウォームアップの完了前に行われた場合でも、
+    get_default_client()のロックにより、インスタンスは1つだけ作成されます。
+
+    Returns:
+        threading.Thread: 起動したデーモンスレッド（通常は待機する必要はありません）
+    """
+    thread = threading.Thread(
+        target=_warm_up_default_client,
+        name="bedrock-kb-client-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread
@@ -12,13 +12,26 @@ Bedrock Knowledge Baseの管理機能をMCPツールとして公開します。
 - S3ドキュメントの管理
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+import operator
+import os
+import random
+import re
+import stat
+import string
+from functools import lru_cache
+from typing import Dict, Any, NoReturn, Optional, Tuple
 
 from fastmcp import FastMCP
 
 from bedrock_kb_mcp_server import __version__
-from bedrock_kb_mcp_server.bedrock_client import BedrockKBClient
+from bedrock_kb_mcp_server.bedrock_client import (
+    INGESTION_JOB_TERMINAL_STATES,
+    get_default_client,
+    get_regional_client,
+    warm_up_default_client,
+)
 from bedrock_kb_mcp_server.models import (
     StorageType,
     SourceType,
@@ -37,17 +50,22 @@ from bedrock_kb_mcp_server.types import (
     DataSourceResponseDict,
     DataSourceListResponseDict,
     IngestionJobResponseDict,
+    IngestionJobWaitResponseDict,
     RetrieveResponseDict,
+    BatchRetrieveResponseDict,
+    CacheClearResponseDict,
     S3UploadResponseDict,
     S3DocumentListResponseDict,
     S3BucketCreateResponseDict,
     IAMRoleCreateResponseDict,
+    KBInfrastructureResponseDict,
 )
 from bedrock_kb_mcp_server.utils import (
     validate_aws_credentials,
     setup_logging,
     handle_errors,
     validate_required_string,
+    strip_or_none,
 )
 
 # ============================================================================
@@ -75,7 +93,7 @@ try:
 except Exception as e:
     # 認証情報の検証でエラーが発生しても、サーバーの起動は続行します
     # 実際のAPI呼び出し時に認証エラーが発生する可能性があることを警告します
-    logger.warning(f"AWS credentials validation: {e}")
+    logger.warning("AWS credentials validation: %s", e)
 
 # ============================================================================
 # MCPサーバーの初期化
@@ -91,11 +109,160 @@ mcp = FastMCP("bedrock-kb-mcp-server", __version__)
 # Bedrockクライアントの初期化
 # ============================================================================
 
-# Bedrock Knowledge Base APIクライアントを初期化
-# このクライアントは、すべてのMCPツール関数から共有して使用されます
+# Bedrock Knowledge Base APIクライアントは、get_default_client()で取得します
+# このクライアントはプロセス全体で1つだけ作成され、すべてのMCPツール関数から共有して使用されます
+# （ツール呼び出しごとにboto3クライアントを初期化するコストを避けます）
+# boto3のクライアントはスレッドセーフなため、I/Oが主体のツールでは
+# asyncio.to_thread()でワーカースレッドから呼び出し、イベントループをブロックしません
 # AWS認証情報は環境変数またはAWS設定ファイルから自動的に取得されます
 # リージョンは環境変数AWS_REGIONから取得されます（デフォルト: us-east-1）
-bedrock_client = BedrockKBClient()
+
+# boto3クライアントの初期化（サービスモデルの読み込み、認証情報の解決など）は時間がかかるため、
+# バックグラウンドスレッドで先に開始しておきます
+# モジュールの読み込み（およびMCPのinitializeへの応答）はこの処理の完了を待たずに進み、
+# 最初のツール呼び出しでは作成済みのクライアントをそのまま使用できます
+warm_up_default_client()
+
+# ============================================================================
+# 入力値変換用のルックアップテーブルとヘルパー
+# ============================================================================
+
+# 文字列から列挙型への変換テーブル
+# Enumのコンストラクタ（StorageType("S3")など）は、無効な値の場合に_missing_を経由して
+# 例外を生成するためコストがかかります。モジュール読み込み時に辞書を1度だけ構築し、
+# ツール呼び出しごとの変換は辞書の参照（.get）のみで済ませます
+_STORAGE_TYPES: Dict[str, StorageType] = {m.value: m for m in StorageType}
+_SOURCE_TYPES: Dict[str, SourceType] = {m.value: m for m in SourceType}
+_PARSING_STRATEGIES: Dict[str, ParsingStrategy] = {m.value: m for m in ParsingStrategy}
+_CHUNKING_STRATEGIES: Dict[str, ChunkingStrategy] = {m.value: m for m in ChunkingStrategy}
+
+# マルチモーダルストレージのS3 URIの形式（s3://bucket[/path]）
+# バケット名が空のURI（"s3://"や"s3:///path"）は一致しません
+_S3_URI_PATTERN = re.compile(r"^s3://[^/]+(/.*)?$")
+
+# S3バケット名・IAMロール名のバリデーション用の正規表現
+# ツール呼び出しごとにパターンを解析しないよう、モジュール読み込み時に1度だけコンパイルします
+_BUCKET_NAME_RE = re.compile(r"^[a-z0-9][a-z0-9.-]*[a-z0-9]$")  # 小文字・数字・ハイフン・ピリオド
+_BUCKET_IP_RE = re.compile(r"^(\d{1,3}\.){3}\d{1,3}$")  # IPアドレス形式（簡易版）
+
+# IAMロール名に使用可能な文字（英数字と「_+=,.@-」）
+# 使用可能な文字をすべて削除する変換テーブルを作成しておき、str.translate()の結果に
+# 文字が残っていれば、使用できない文字が含まれていると判定します（正規表現エンジンを使わない1回の走査）
+_IAM_ROLE_NAME_CHARS = string.ascii_letters + string.digits + "_+=,.@-"
+_IAM_ROLE_NAME_STRIP_TABLE = str.maketrans("", "", _IAM_ROLE_NAME_CHARS)
+
+# S3バケット名のルール（3-63文字、使用可能な文字、先頭・末尾、連続するピリオド/ハイフン、IPアドレス形式）を
+# 1つにまとめた正規表現
+# 有効なバケット名はこのパターン1回の照合だけで検証し、
+# 一致しなかった場合のみ個別のチェックで具体的なエラーメッセージを決定します
+_BUCKET_VALIDATE_RE = re.compile(
+    r"^(?!(?:\d{1,3}\.){3}\d{1,3}$)(?!.*\.\.)(?!.*--)[a-z0-9][a-z0-9.-]{1,61}[a-z0-9]$"
+)
+
+# batch_retrieveで1回に指定できるクエリ数の上限
+# 1回のツール呼び出しでBedrockへのリクエストが過剰に発生しないように制限します
+_BATCH_RETRIEVE_MAX_QUERIES = 50
+
+# await_ingestion_jobのポーリング間隔の設定
+# 1回ごとに間隔を1.5倍に延ばし（最大30秒）、±20%のジッターを加えて
+# 複数のジョブを同時に待機する場合でもAPI呼び出しのタイミングが揃わないようにします
+_INGESTION_WAIT_BACKOFF = 1.5
+_INGESTION_WAIT_MAX_INTERVAL = 30.0
+_INGESTION_WAIT_JITTER = 0.2
+
+
+@lru_cache(maxsize=128)
+def _build_vector_ingestion_config(
+    parsing_strategy: str,
+    parsing_model_arn: str,
+    parsing_modality: str,
+    parsing_prompt_text: str,
+    chunking_strategy: str,
+    chunking_max_tokens: int,
+    chunking_overlap_percentage: int,
+    chunking_overlap_tokens: int,
+    chunking_buffer_size: int,
+    chunking_breakpoint_threshold: int,
+) -> Tuple[Optional[VectorIngestionConfiguration], Optional[Dict[str, Any]]]:
+    """
+    ベクトル取り込み設定（パーシング・チャンキング設定）を構築します。
+
+    MCPツールの引数をそのまま受け取り、Pydanticモデルによる検証とAWS API形式への変換を行います。
+    結果はlru_cacheでキャッシュされるため、同じパラメータの組み合わせでは
+    モデルの検証と辞書の構築は初回の1回だけ実行されます。
+    検証に失敗した場合（例外が発生した場合）はキャッシュされません。
+
+    注意: 戻り値はキャッシュ内のオブジェクトを共有しているため、呼び出し元で変更しないでください。
+
+    Args:
+        parsing_strategy: パーシング戦略（空文字列の場合はパーシング設定なし）
+        parsing_model_arn: パーシングに使用するFoundation ModelのARN
+        parsing_modality: マルチモーダル設定（"MULTIMODAL"）
+        parsing_prompt_text: パーシングプロンプトのテキスト
+        chunking_strategy: チャンキング戦略（空文字列の場合はチャンキング設定なし）
+        chunking_max_tokens: 最大トークン数（0以下の場合は未指定）
+        chunking_overlap_percentage: オーバーラップ率（0以下の場合は未指定）
+        chunking_overlap_tokens: オーバーラップトークン数（0以下の場合は未指定）
+        chunking_buffer_size: バッファサイズ（0以下の場合は未指定）
+        chunking_breakpoint_threshold: ブレークポイントのパーセンタイル閾値（0以下の場合は未指定）
+
+    Returns:
+        Tuple[Optional[VectorIngestionConfiguration], Optional[Dict[str, Any]]]:
+            検証済みのモデルと、AWS API形式のvectorIngestionConfiguration辞書のタプル
+            （どちらの戦略も指定されていない場合は(None, None)）
+
+    Raises:
+        ValueError: 戦略名が無効な場合、またはPydanticの検証に失敗した場合
+    """
+    if not (parsing_strategy or chunking_strategy):
+        return None, None
+
+    # パーシング設定を構築
+    parsing_config = None
+    if parsing_strategy:
+        parsing_strategy_enum = _PARSING_STRATEGIES.get(parsing_strategy)
+        if parsing_strategy_enum is None:
+            raise ValueError(
+                f"Invalid parsing_strategy: {parsing_strategy}. "
+                f"Must be one of {', '.join(_PARSING_STRATEGIES)}"
+            )
+        parsing_config = ParsingConfiguration(
+            parsing_strategy=parsing_strategy_enum,
+            parsing_model_arn=parsing_model_arn or None,
+            parsing_modality=parsing_modality or None,
+            parsing_prompt_text=parsing_prompt_text or None,
+        )
+
+    # チャンキング設定を構築
+    chunking_config = None
+    if chunking_strategy:
+        chunking_strategy_enum = _CHUNKING_STRATEGIES.get(chunking_strategy)
+        if chunking_strategy_enum is None:
+            raise ValueError(
+                f"Invalid chunking_strategy: {chunking_strategy}. "
+                f"Must be one of {', '.join(_CHUNKING_STRATEGIES)}"
+            )
+        # 0以下の値は「指定なし」としてNoneに変換します
+        overlap_percentage = (
+            chunking_overlap_percentage if chunking_overlap_percentage > 0 else None
+        )
+        breakpoint_threshold = (
+            chunking_breakpoint_threshold if chunking_breakpoint_threshold > 0 else None
+        )
+        chunking_config = ChunkingConfiguration(
+            chunking_strategy=chunking_strategy_enum,
+            max_tokens=chunking_max_tokens if chunking_max_tokens > 0 else None,
+            overlap_percentage=overlap_percentage,
+            overlap_tokens=chunking_overlap_tokens if chunking_overlap_tokens > 0 else None,
+            buffer_size=chunking_buffer_size if chunking_buffer_size > 0 else None,
+            breakpoint_percentile_threshold=breakpoint_threshold,
+        )
+
+    vector_ingestion_config = VectorIngestionConfiguration(
+        parsing_configuration=parsing_config,
+        chunking_configuration=chunking_config,
+    )
+    return vector_ingestion_config, vector_ingestion_config.to_api_dict()
 
 
 # ============================================================================
@@ -105,7 +272,7 @@ bedrock_client = BedrockKBClient()
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def create_knowledge_base(
+async def create_knowledge_base(
     name: str,
     description: str,
     role_arn: str,
@@ -271,43 +438,26 @@ def create_knowledge_base(
         )
     """
     # ストレージタイプのバリデーション
-    # 入力された文字列をStorageType列挙型に変換して検証します
+    # 入力された文字列を事前構築した辞書でStorageType列挙型に変換して検証します
     # 無効な値の場合はValueErrorが発生し、エラーハンドリングデコレータがキャッチします
-    try:
-        storage_type_enum = StorageType(storage_type)
-    except ValueError:
+    storage_type_enum = _STORAGE_TYPES.get(storage_type)
+    if storage_type_enum is None:
         raise ValueError(f"Invalid storage_type: {storage_type}. Must be 'S3' or 'S3_VECTORS'")
     
     # ベクトル取り込み設定を構築（オプション）
-    vector_ingestion_config = None
-    if parsing_strategy or chunking_strategy:
-        # パーシング設定を構築
-        parsing_config = None
-        if parsing_strategy:
-            parsing_config = ParsingConfiguration(
-                parsing_strategy=ParsingStrategy(parsing_strategy),
-                parsing_model_arn=parsing_model_arn if parsing_model_arn else None,
-                parsing_modality=parsing_modality if parsing_modality else None,
-                parsing_prompt_text=parsing_prompt_text if parsing_prompt_text else None,
-            )
-        
-        # チャンキング設定を構築
-        chunking_config = None
-        if chunking_strategy:
-            chunking_config = ChunkingConfiguration(
-                chunking_strategy=ChunkingStrategy(chunking_strategy),
-                max_tokens=chunking_max_tokens if chunking_max_tokens > 0 else None,
-                overlap_percentage=chunking_overlap_percentage if chunking_overlap_percentage > 0 else None,
-                overlap_tokens=chunking_overlap_tokens if chunking_overlap_tokens > 0 else None,
-                buffer_size=chunking_buffer_size if chunking_buffer_size > 0 else None,
-                breakpoint_percentile_threshold=chunking_breakpoint_threshold if chunking_breakpoint_threshold > 0 else None,
-            )
-        
-        if parsing_config or chunking_config:
-            vector_ingestion_config = VectorIngestionConfiguration(
-                parsing_configuration=parsing_config,
-                chunking_configuration=chunking_config,
-            )
+    # 同じパラメータの組み合わせでは、検証済みのモデルとAPI形式の辞書をキャッシュから再利用します
+    vector_ingestion_config, vector_ingestion_config_dict = _build_vector_ingestion_config(
+        parsing_strategy,
+        parsing_model_arn,
+        parsing_modality,
+        parsing_prompt_text,
+        chunking_strategy,
+        chunking_max_tokens,
+        chunking_overlap_percentage,
+        chunking_overlap_tokens,
+        chunking_buffer_size,
+        chunking_breakpoint_threshold,
+    )
     
     # Pydanticモデルを使用してリクエストパラメータをバリデーション
     # この段階で、ARN形式、文字列長、必須フィールドなどの検証が行われます
@@ -356,11 +506,12 @@ def create_knowledge_base(
         # Amazon Nova Multimodal Embeddings v1を使用する場合に特に重要です
         if multimodal_storage_s3_uri:
             # S3 URI形式を検証（s3://bucket-name/path/形式であることを確認）
+            # 事前にコンパイルした正規表現で、プレフィックスとバケット名の有無をまとめて検証します
             multimodal_uri = multimodal_storage_s3_uri.strip()
-            if not multimodal_uri.startswith("s3://"):
-                raise ValueError("multimodal_storage_s3_uri must start with 's3://'")
-            if len(multimodal_uri) < 7:  # "s3://" + 最低1文字
-                raise ValueError("multimodal_storage_s3_uri must be a valid S3 URI")
+            if not _S3_URI_PATTERN.match(multimodal_uri):
+                raise ValueError(
+                    "multimodal_storage_s3_uri must be a valid S3 URI like s3://bucket[/path]"
+                )
             
             # supplementalDataStorageConfigurationを構築
             # storageLocationsは固定で1要素の配列です
@@ -389,19 +540,17 @@ def create_knowledge_base(
         }
         knowledge_base_configuration = None  # S3タイプでは不要
 
-    # ベクトル取り込み設定をAWS API形式に変換
-    vector_ingestion_config_dict = None
-    if request.vector_ingestion_configuration:
-        vector_ingestion_config_dict = request.vector_ingestion_configuration.to_api_dict()
-    
     # リージョンを正規化（前後の空白を削除、空文字列の場合はus-east-1を使用）
     region_cleaned = region.strip() if region else "us-east-1"
     
-    # 指定されたリージョンで一時的にクライアントを作成
-    kb_client = BedrockKBClient(region=region_cleaned)
+    # 指定されたリージョンの共有クライアントを取得
+    # リージョンごとに1度だけ作成され、以降の呼び出しでは再利用されます
+    kb_client = get_regional_client(region_cleaned)
     
     # Bedrockクライアントを使用してKnowledge Baseを作成
-    result = kb_client.create_knowledge_base(
+    # API呼び出しはワーカースレッドで実行し、イベントループをブロックしません
+    result = await asyncio.to_thread(
+        kb_client.create_knowledge_base,
         name=request.name,
         description=request.description,
         role_arn=request.role_arn,
@@ -414,7 +563,7 @@ def create_knowledge_base(
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def list_knowledge_bases() -> KnowledgeBaseListResponseDict:
+async def list_knowledge_bases() -> KnowledgeBaseListResponseDict:
     """
     すべてのAmazon Bedrock Knowledge Baseの一覧を取得します。
     
@@ -425,7 +574,8 @@ def list_knowledge_bases() -> KnowledgeBaseListResponseDict:
     """
     # BedrockクライアントからすべてのKnowledge Baseを取得
     # ページネーションが自動的に処理され、すべてのKnowledge Baseが取得されます
-    knowledge_bases = bedrock_client.list_knowledge_bases()
+    # API呼び出しはワーカースレッドで実行し、イベントループをブロックしません
+    knowledge_bases = await asyncio.to_thread(get_default_client().list_knowledge_bases)
     
     # レスポンスを整形して返す
     # count: Knowledge Baseの総数
@@ -438,7 +588,7 @@ def list_knowledge_bases() -> KnowledgeBaseListResponseDict:
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def get_knowledge_base(knowledge_base_id: str) -> KnowledgeBaseDetailDict:
+async def get_knowledge_base(knowledge_base_id: str) -> KnowledgeBaseDetailDict:
     """
     特定のAmazon Bedrock Knowledge Baseの詳細情報を取得します。
     
@@ -461,13 +611,14 @@ def get_knowledge_base(knowledge_base_id: str) -> KnowledgeBaseDetailDict:
     knowledge_base_id = validate_required_string(knowledge_base_id, "knowledge_base_id")
     
     # BedrockクライアントからKnowledge Baseの詳細を取得
-    kb = bedrock_client.get_knowledge_base(knowledge_base_id)
+    # API呼び出しはワーカースレッドで実行し、イベントループをブロックしません
+    kb = await asyncio.to_thread(get_default_client().get_knowledge_base, knowledge_base_id)
     return kb
 
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def update_knowledge_base(
+async def update_knowledge_base(
     knowledge_base_id: str,
     name: str = "",
     description: str = "",
@@ -499,11 +650,14 @@ def update_knowledge_base(
     
     # Bedrockクライアントを使用してKnowledge Baseを更新
     # 空文字列の場合はNoneに変換して、既存の値を保持する
-    result = bedrock_client.update_knowledge_base(
+    # API呼び出しはワーカースレッドで実行し、イベントループをブロックしません
+    result = await asyncio.to_thread(
+        get_default_client().update_knowledge_base,
         knowledge_base_id=knowledge_base_id,
-        name=name.strip() if name else None,
-        description=description.strip() if description else None,
-        role_arn=role_arn.strip() if role_arn else None,
+        # 空文字列（空白のみを含む）のパラメータはNoneとして渡し、更新対象から除外します
+        name=strip_or_none(name),
+        description=strip_or_none(description),
+        role_arn=strip_or_none(role_arn),
     )
     return result
 
@@ -515,7 +669,7 @@ def update_knowledge_base(
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def create_data_source(
+async def create_data_source(
     knowledge_base_id: str,
     name: str,
     source_type: str = "S3",
@@ -638,41 +792,24 @@ def create_data_source(
         )
     """
     # データソースタイプのバリデーション
-    try:
-        source_type_enum = SourceType(source_type)
-    except ValueError:
+    source_type_enum = _SOURCE_TYPES.get(source_type)
+    if source_type_enum is None:
         raise ValueError(f"Invalid source_type: {source_type}. Must be 'S3'")
     
     # ベクトル取り込み設定を構築（オプション）
-    vector_ingestion_config = None
-    if parsing_strategy or chunking_strategy:
-        # パーシング設定を構築
-        parsing_config = None
-        if parsing_strategy:
-            parsing_config = ParsingConfiguration(
-                parsing_strategy=ParsingStrategy(parsing_strategy),
-                parsing_model_arn=parsing_model_arn if parsing_model_arn else None,
-                parsing_modality=parsing_modality if parsing_modality else None,
-                parsing_prompt_text=parsing_prompt_text if parsing_prompt_text else None,
-            )
-        
-        # チャンキング設定を構築
-        chunking_config = None
-        if chunking_strategy:
-            chunking_config = ChunkingConfiguration(
-                chunking_strategy=ChunkingStrategy(chunking_strategy),
-                max_tokens=chunking_max_tokens if chunking_max_tokens > 0 else None,
-                overlap_percentage=chunking_overlap_percentage if chunking_overlap_percentage > 0 else None,
-                overlap_tokens=chunking_overlap_tokens if chunking_overlap_tokens > 0 else None,
-                buffer_size=chunking_buffer_size if chunking_buffer_size > 0 else None,
-                breakpoint_percentile_threshold=chunking_breakpoint_threshold if chunking_breakpoint_threshold > 0 else None,
-            )
-        
-        if parsing_config or chunking_config:
-            vector_ingestion_config = VectorIngestionConfiguration(
-                parsing_configuration=parsing_config,
-                chunking_configuration=chunking_config,
-            )
+    # 同じパラメータの組み合わせでは、検証済みのモデルとAPI形式の辞書をキャッシュから再利用します
+    vector_ingestion_config, vector_ingestion_config_dict = _build_vector_ingestion_config(
+        parsing_strategy,
+        parsing_model_arn,
+        parsing_modality,
+        parsing_prompt_text,
+        chunking_strategy,
+        chunking_max_tokens,
+        chunking_overlap_percentage,
+        chunking_overlap_tokens,
+        chunking_buffer_size,
+        chunking_breakpoint_threshold,
+    )
     
     # Pydanticモデルを使用してリクエストパラメータをバリデーション
     request = CreateDataSourceRequest(
@@ -688,9 +825,11 @@ def create_data_source(
     # ユーザーが"documents/,images/"のようにカンマ区切りで指定した場合、
     # ["documents/", "images/"]のようなリストに変換します
     # 空文字列や空白のみの要素は除外し、各要素の前後の空白を削除します
-    prefixes = [
-        p.strip() for p in request.inclusion_prefixes.split(",") if p.strip()
-    ] if request.inclusion_prefixes else []
+    # strip()は要素ごとに1回だけ呼び出し、filter(None, ...)で空文字列を除外します
+    prefixes = (
+        list(filter(None, map(str.strip, request.inclusion_prefixes.split(","))))
+        if request.inclusion_prefixes else []
+    )
 
     # AWS API用のデータソース設定を構築
     # dataSourceConfigurationは、データソースの種類と設定を定義します
@@ -709,13 +848,10 @@ def create_data_source(
     if prefixes:
         data_source_configuration["s3Configuration"]["inclusionPrefixes"] = prefixes
 
-    # ベクトル取り込み設定をAWS API形式に変換
-    vector_ingestion_config_dict = None
-    if request.vector_ingestion_configuration:
-        vector_ingestion_config_dict = request.vector_ingestion_configuration.to_api_dict()
-
     # Bedrockクライアントを使用してデータソースを作成
-    result = bedrock_client.create_data_source(
+    # API呼び出しはワーカースレッドで実行し、イベントループをブロックしません
+    result = await asyncio.to_thread(
+        get_default_client().create_data_source,
         knowledge_base_id=request.knowledge_base_id,
         name=request.name,
         data_source_configuration=data_source_configuration,
@@ -726,7 +862,7 @@ def create_data_source(
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def list_data_sources(knowledge_base_id: str) -> DataSourceListResponseDict:
+async def list_data_sources(knowledge_base_id: str) -> DataSourceListResponseDict:
     """
     指定されたKnowledge Baseのデータソース一覧を取得します。
     
@@ -752,7 +888,9 @@ def list_data_sources(knowledge_base_id: str) -> DataSourceListResponseDict:
     knowledge_base_id = validate_required_string(knowledge_base_id, "knowledge_base_id")
     
     # Bedrockクライアントからデータソース一覧を取得
-    data_sources = bedrock_client.list_data_sources(knowledge_base_id)
+    data_sources = await asyncio.to_thread(
+        get_default_client().list_data_sources, knowledge_base_id
+    )
     return {
         "count": len(data_sources),
         "data_sources": data_sources,
@@ -766,7 +904,7 @@ def list_data_sources(knowledge_base_id: str) -> DataSourceListResponseDict:
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def start_ingestion_job(
+async def start_ingestion_job(
     knowledge_base_id: str, data_source_id: str
 ) -> IngestionJobResponseDict:
     """
@@ -798,15 +936,15 @@ def start_ingestion_job(
     data_source_id = validate_required_string(data_source_id, "data_source_id")
     
     # Bedrockクライアントを使用して取り込みジョブを開始
-    result = bedrock_client.start_ingestion_job(
-        knowledge_base_id, data_source_id
+    result = await asyncio.to_thread(
+        get_default_client().start_ingestion_job, knowledge_base_id, data_source_id
     )
     return result
 
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def get_ingestion_job(
+async def get_ingestion_job(
     knowledge_base_id: str, data_source_id: str, ingestion_job_id: str
 ) -> IngestionJobResponseDict:
     """
@@ -829,7 +967,10 @@ def get_ingestion_job(
                 - "FAILED": ジョブが失敗
             - statistics: 統計情報（オプション、ジョブが進行中または完了している場合）
                 - numberOfDocumentsScanned: スキャンされたドキュメント数
-                - numberOfDocumentsModified: 変更されたドキュメント数
+                - numberOfMetadataDocumentsScanned: スキャンされたメタデータドキュメント数
+                - numberOfNewDocumentsIndexed: 新規にインデックスされたドキュメント数
+                - numberOfModifiedDocumentsIndexed: 変更されてインデックスされたドキュメント数
+                - numberOfMetadataDocumentsModified: 変更されたメタデータドキュメント数
                 - numberOfDocumentsDeleted: 削除されたドキュメント数
                 - numberOfDocumentsFailed: 失敗したドキュメント数
     
@@ -842,20 +983,129 @@ def get_ingestion_job(
     ingestion_job_id = validate_required_string(ingestion_job_id, "ingestion_job_id")
     
     # Bedrockクライアントから取り込みジョブの詳細を取得
-    result = bedrock_client.get_ingestion_job(
-        knowledge_base_id, data_source_id, ingestion_job_id
+    result = await asyncio.to_thread(
+        get_default_client().get_ingestion_job,
+        knowledge_base_id,
+        data_source_id,
+        ingestion_job_id,
     )
     return result
 
 
+@mcp.tool()  # MCPツールとして公開
+@handle_errors  # エラーハンドリングデコレータを適用
+async def await_ingestion_job(
+    knowledge_base_id: str,
+    data_source_id: str,
+    ingestion_job_id: str,
+    timeout_seconds: int = 600,
+    poll_interval_seconds: float = 2.0,
+) -> IngestionJobWaitResponseDict:
+    """
+    取り込みジョブが終了するまで待機し、最終的なステータスを返します。
+    
+    サーバー側でget_ingestion_jobをポーリングするため、クライアントが
+    get_ingestion_jobを繰り返し呼び出す必要はありません。
+    ポーリング間隔は1回ごとに1.5倍に延ばし（最大30秒、±20%のジッター付き）、
+    長時間のジョブでもAPI呼び出しの回数を抑えます。
+    ジョブが終了状態（COMPLETE、FAILED、STOPPED）になるか、タイムアウトした時点で返ります。
+
+    Args:
+        knowledge_base_id: Knowledge BaseのID
+        data_source_id: データソースのID
+        ingestion_job_id: 取り込みジョブのID（`start_ingestion_job`で取得）
+        timeout_seconds: 最大待機時間（秒、デフォルト: 600、範囲: 1-3600）
+        poll_interval_seconds: 最初のポーリング間隔（秒、デフォルト: 2.0、範囲: 0.5-30）
+
+    Returns:
+        IngestionJobWaitResponseDict: 取り込みジョブの詳細情報
+            - ingestion_job_id: 取り込みジョブのID
+            - status: ジョブのステータス（タイムアウトした場合は最後に取得したステータス）
+            - statistics: 統計情報（オプション、項目はget_ingestion_jobと同じIngestionJobStatisticsDict）
+            - timed_out: 終了状態になる前にタイムアウトした場合はTrue
+            - elapsed_seconds: 待機した時間（秒）
+    
+    Raises:
+        ValueError: いずれかのIDが空の場合、またはtimeout_seconds・poll_interval_secondsが範囲外の場合
+    
+    Example:
+        job = start_ingestion_job("KB123", "DS456")
+        await_ingestion_job("KB123", "DS456", job["ingestion_job_id"], timeout_seconds=900)
+    """
+    # 入力値のバリデーション（共通関数を使用）
+    knowledge_base_id = validate_required_string(knowledge_base_id, "knowledge_base_id")
+    data_source_id = validate_required_string(data_source_id, "data_source_id")
+    ingestion_job_id = validate_required_string(ingestion_job_id, "ingestion_job_id")
+    if not (1 <= timeout_seconds <= 3600):
+        raise ValueError("timeout_seconds must be between 1 and 3600")
+    if not (0.5 <= poll_interval_seconds <= _INGESTION_WAIT_MAX_INTERVAL):
+        raise ValueError("poll_interval_seconds must be between 0.5 and 30")
+    
+    client = get_default_client()
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    deadline = started_at + timeout_seconds
+    interval = poll_interval_seconds
+    
+    while True:
+        # Bedrockクライアントから取り込みジョブの詳細を取得
+        # 実行中のジョブの結果は短時間キャッシュされるため、間隔が短い場合でもAPI呼び出しは抑えられます
+        result = await asyncio.to_thread(
+            client.get_ingestion_job,
+            knowledge_base_id,
+            data_source_id,
+            ingestion_job_id,
+        )
+        now = loop.time()
+        timed_out = now >= deadline
+        if result["status"] in INGESTION_JOB_TERMINAL_STATES or timed_out:
+            break
+        
+        # 次のポーリングまで待機（ジッターを加え、期限を超えないようにします）
+        delay = interval * random.uniform(1 - _INGESTION_WAIT_JITTER, 1 + _INGESTION_WAIT_JITTER)
+        await asyncio.sleep(min(delay, deadline - now))
+        interval = min(interval * _INGESTION_WAIT_BACKOFF, _INGESTION_WAIT_MAX_INTERVAL)
+    
+    return {
+        **result,
+        "timed_out": timed_out and result["status"] not in INGESTION_JOB_TERMINAL_STATES,
+        "elapsed_seconds": round(loop.time() - started_at, 3),
+    }
+
+
 # ============================================================================
 # Query Tools
 # ============================================================================
 
 
+def _validate_number_of_results(number_of_results: int) -> int:
+    """
+    RAGクエリで返す結果の数を検証します。
+    
+    operator.indexで整数への変換を行うため、5.0や5.5のような浮動小数点数は
+    範囲チェックの前に拒否されます（端数が黙って受け入れられることはありません）。
+    
+    Args:
+        number_of_results: 返す結果の数
+    
+    Returns:
+        int: 検証済みの結果の数
+    
+    Raises:
+        ValueError: 整数でない場合、または1から100の範囲外の場合
+    """
+    try:
+        number_of_results = operator.index(number_of_results)
+    except TypeError:
+        raise ValueError("number_of_results must be an integer") from None
+    if not (1 <= number_of_results <= 100):
+        raise ValueError("number_of_results must be between 1 and 100")
+    return number_of_results
+
+
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def retrieve(
+async def retrieve(
     knowledge_base_id: str, query: str, number_of_results: int = 5
 ) -> RetrieveResponseDict:
     """
@@ -881,15 +1131,16 @@ def retrieve(
     knowledge_base_id = validate_required_string(knowledge_base_id, "knowledge_base_id")
     query = validate_required_string(query, "query")
     
-    # number_of_resultsは1から100の範囲で指定する必要があります
+    # number_of_resultsは1から100の範囲の整数で指定する必要があります
     # AWS APIの制限に従います
-    if number_of_results < 1 or number_of_results > 100:
-        raise ValueError("number_of_results must be between 1 and 100")
+    number_of_results = _validate_number_of_results(number_of_results)
 
     # Bedrockクライアントを使用してRAGクエリを実行
     # ベクトル検索を使用して、クエリに関連するドキュメントを取得します
     # 結果は関連度スコアでソートされ、指定された数の結果が返されます
-    result = bedrock_client.retrieve(
+    # API呼び出しはワーカースレッドで実行し、他のツール呼び出しと並行して処理できるようにします
+    result = await asyncio.to_thread(
+        get_default_client().retrieve,
         knowledge_base_id,  # 前後の空白は既に削除済み
         query,  # 前後の空白は既に削除済み
         number_of_results  # 返す結果の数
@@ -897,6 +1148,82 @@ def retrieve(
     return result
 
 
+@mcp.tool()  # MCPツールとして公開
+@handle_errors  # エラーハンドリングデコレータを適用
+async def batch_retrieve(
+    knowledge_base_id: str, queries: list[str], number_of_results: int = 5
+) -> BatchRetrieveResponseDict:
+    """
+    Knowledge Baseに対して複数のRAGクエリを並列に実行します。
+    
+    複数のクエリを1回のツール呼び出しでまとめて実行します。
+    各クエリはスレッドプールで同時に実行されるため、retrieveを繰り返し呼び出す場合と比べて、
+    全体の待ち時間は最も遅いクエリの待ち時間に近くなります。
+    
+    Args:
+        knowledge_base_id: クエリ対象のKnowledge BaseのID
+        queries: 検索クエリのテキストのリスト（1-50件）
+        number_of_results: 各クエリで返す結果の数（デフォルト: 5、範囲: 1-100）
+
+    Returns:
+        BatchRetrieveResponseDict: クエリ結果
+            - count: 実行したクエリの数
+            - results: 各クエリの結果のリスト（queriesと同じ順序）
+                各要素の形式はretrieveの戻り値と同じです（results、query）
+    
+    Raises:
+        ValueError: 入力値が無効な場合（knowledge_base_idやクエリが空、クエリ数やnumber_of_resultsが範囲外など）
+    
+    Example:
+        batch_retrieve(
+            knowledge_base_id="KB123",
+            queries=["What is RAG?", "How do I create a data source?"],
+            number_of_results=3
+        )
+    """
+    # 入力値のバリデーション（共通関数を使用）
+    knowledge_base_id = validate_required_string(knowledge_base_id, "knowledge_base_id")
+    if not queries:
+        raise ValueError("queries is required")
+    if len(queries) > _BATCH_RETRIEVE_MAX_QUERIES:
+        raise ValueError(f"queries must contain at most {_BATCH_RETRIEVE_MAX_QUERIES} items")
+    # 各クエリも必須文字列として検証し、前後の空白を削除します
+    queries = [validate_required_string(q, "query") for q in queries]
+    
+    # number_of_resultsは1から100の範囲の整数で指定する必要があります
+    number_of_results = _validate_number_of_results(number_of_results)
+
+    # すべてのクエリをワーカースレッド内のスレッドプールで並列に実行します
+    # 同時実行数はBedrockKBClient.retrieve_manyの既定値（8）に従い、共有の接続プールを超えないようにします
+    results = await asyncio.to_thread(
+        get_default_client().retrieve_many,
+        knowledge_base_id,  # 前後の空白は既に削除済み
+        queries,  # 前後の空白は既に削除済み
+        number_of_results,  # 各クエリで返す結果の数
+    )
+    return {"count": len(results), "results": results}
+
+
+@mcp.tool()  # MCPツールとして公開
+@handle_errors  # エラーハンドリングデコレータを適用
+def clear_retrieve_cache() -> CacheClearResponseDict:
+    """
+    RAGクエリ（retrieve / batch_retrieve）の結果キャッシュを削除します。
+    
+    retrieveの結果は、同じKnowledge Base・クエリ・結果数の組み合わせで一定時間
+    （デフォルト: 300秒、環境変数BEDROCK_KB_RETRIEVE_CACHE_TTLで変更可能）キャッシュされます。
+    ドキュメントを更新した直後など、有効期限を待たずに最新の検索結果を取得したい場合に使用します。
+
+    Returns:
+        CacheClearResponseDict: 削除結果
+            - cleared: 削除したキャッシュエントリの数
+            - status: "cleared"
+    """
+    # キャッシュの削除はメモリ上の操作のみのため、ワーカースレッドは使用しません
+    cleared = get_default_client().clear_retrieve_cache()
+    return {"cleared": cleared, "status": "cleared"}
+
+
 # ============================================================================
 # S3 Document Management Tools
 # ============================================================================
@@ -904,20 +1231,29 @@ def retrieve(
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def upload_document_to_s3(
-    local_file_path: str, bucket_name: str, s3_key: str
+async def upload_document_to_s3(
+    local_file_path: str,
+    bucket_name: str,
+    s3_key: str,
+    max_concurrency: int = 0,
+    part_size_mb: int = 0,
 ) -> S3UploadResponseDict:
     """
     ローカルファイルをS3バケットにアップロードします。
     
     アップロードされたファイルは、Knowledge Baseのデータソースとして
     使用できます。
+    16MB以上のファイルは、16MB単位のパートを最大20並列で送信するマルチパートアップロードになります。
+    非常に大きなファイルでは、max_concurrencyとpart_size_mbで並列数とパートサイズを調整できます。
 
     Args:
         local_file_path: アップロードするローカルファイルのパス
         bucket_name: アップロード先のS3バケット名
         s3_key: S3オブジェクトキー（バケット内のパス）
                 例: "documents/myfile.pdf" のようにパスを指定可能
+        max_concurrency: パートを同時に送信する最大数（オプション、0の場合は既定値の20、範囲: 1-50）
+        part_size_mb: 各パートのサイズ（MB、オプション、0の場合は既定値の16、範囲: 5-5120）
+                      この値未満のファイルは、マルチパートを使わず1回のリクエストで送信されます
 
     Returns:
         S3UploadResponseDict: アップロード結果
@@ -925,7 +1261,8 @@ def upload_document_to_s3(
             - status: アップロードステータス（"uploaded"）
     
     Raises:
-        ValueError: パラメータが空の場合、またはファイルが存在しない場合
+        ValueError: パラメータが空の場合、ファイルが存在しない場合、
+                    またはmax_concurrency・part_size_mbが範囲外の場合
     
     Example:
         upload_document_to_s3(
@@ -934,47 +1271,82 @@ def upload_document_to_s3(
             "documents/document.pdf"
         )
         # 戻り値: {"s3_uri": "s3://my-bucket/documents/document.pdf", "status": "uploaded"}
+        
+        # 大きな動画ファイルを64MB単位・32並列でアップロード
+        upload_document_to_s3(
+            "/path/to/video.mp4", "my-bucket", "videos/video.mp4",
+            max_concurrency=32, part_size_mb=64
+        )
     """
-    import os
-    
     # 入力値のバリデーション（共通関数を使用）
     # すべてのパラメータは必須です
     local_file_path = validate_required_string(local_file_path, "local_file_path")
     bucket_name = validate_required_string(bucket_name, "bucket_name")
     s3_key = validate_required_string(s3_key, "s3_key")
     
+    # マルチパートアップロードの設定（0の場合は既定値を使用）
+    # S3のパートサイズは5MB以上（最大5GB）である必要があります
+    if max_concurrency and not (1 <= max_concurrency <= 50):
+        raise ValueError("max_concurrency must be between 1 and 50")
+    if part_size_mb and not (5 <= part_size_mb <= 5120):
+        raise ValueError("part_size_mb must be between 5 and 5120")
+    
     # ファイルの存在確認
     # ローカルファイルシステム上にファイルが存在することを確認します
     # ファイルが存在しない場合、S3へのアップロードは失敗するため、事前にチェックします
-    if not os.path.exists(local_file_path):
+    # os.stat()を1回だけ呼び出し、存在確認と同時に取得したファイルサイズをアップロード処理に渡します
+    try:
+        file_stat = os.stat(local_file_path)
+    except FileNotFoundError:
         raise ValueError(f"File not found: {local_file_path}")
+    if not stat.S_ISREG(file_stat.st_mode):
+        raise ValueError(f"Not a regular file: {local_file_path}")
     
-    # 注意: ファイルサイズのチェックは行っていません
+    # 注意: ファイルサイズの上限チェックは行っていません
     # 非常に大きなファイルの場合、アップロードに時間がかかる可能性があります
 
     # Bedrockクライアントを使用してS3にアップロード
-    result = bedrock_client.upload_document_to_s3(
+    # アップロードはワーカースレッドで実行し、イベントループをブロックしません
+    result = await asyncio.to_thread(
+        get_default_client().upload_document_to_s3,
         local_file_path,  # 前後の空白は既に削除済み
         bucket_name,  # 前後の空白は既に削除済み
-        s3_key  # 前後の空白は既に削除済み
+        s3_key,  # 前後の空白は既に削除済み
+        file_stat.st_size,  # 小さなファイルは1回のPUTでアップロードされます
+        max_concurrency or None,  # 0の場合は共有の転送設定を使用
+        part_size_mb * 1024 * 1024 if part_size_mb else None,
     )
     return result
 
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def list_s3_documents(bucket_name: str, prefix: str = "") -> S3DocumentListResponseDict:
+async def list_s3_documents(
+    bucket_name: str,
+    prefix: str = "",
+    parallel: bool = False,
+    max_results: int = 1000,
+    continuation_token: str = "",
+) -> S3DocumentListResponseDict:
     """
     S3バケット内のドキュメント一覧を取得します。
     
     指定されたプレフィックス（フォルダ）に一致するドキュメントのみを
     取得することもできます。
+    1回の呼び出しで取得するのは最大max_results件までで、続きがある場合は
+    レスポンスのnext_tokenをcontinuation_tokenに指定して再度呼び出します。
 
     Args:
         bucket_name: S3バケット名
         prefix: フィルタリングするS3プレフィックス（オプション）
                 例: "documents/" を指定すると、documents/フォルダ内の
                     ファイルのみが返されます
+        parallel: プレフィックス直下のフォルダごとに並列で一覧を取得するかどうか
+                  （オプション、デフォルト: False）
+                  多数のフォルダに大量のオブジェクトがあるバケットで高速化できます
+                  Trueの場合はmax_results・continuation_tokenを使用せず、すべてのドキュメントを返します
+        max_results: 1回の呼び出しで取得する最大ドキュメント数（デフォルト: 1000、範囲: 1-10000）
+        continuation_token: 前回の呼び出しで返されたnext_token（続きから取得する場合）
 
     Returns:
         S3DocumentListResponseDict: ドキュメント一覧
@@ -985,17 +1357,39 @@ def list_s3_documents(bucket_name: str, prefix: str = "") -> S3DocumentListRespo
                 各要素には以下の情報が含まれます:
                 - key: S3オブジェクトキー（ファイルパス）
                 - size: ファイルサイズ（バイト）
-                - last_modified: 最終更新日時（ISO形式）
+                - last_modified: 最終更新日時（ISO形式の文字列としてシリアライズされます）
+            - next_token: 続きを取得するためのトークン（すべて取得済みの場合はNone）
     
     Raises:
-        ValueError: bucket_nameが空の場合
+        ValueError: bucket_nameが空の場合、max_resultsが範囲外の場合、
+                    またはparallelとcontinuation_tokenを同時に指定した場合
     
     Example:
-        # すべてのドキュメントを取得
-        list_s3_documents("my-bucket")
+        # 最初のページ（最大1000件）を取得
+        # バケット全体ではありません。next_tokenがNoneでない場合は続きがあります
+        page = list_s3_documents("my-bucket")
         
-        # 特定のプレフィックスのドキュメントのみを取得
+        # next_tokenをたどってすべてのドキュメントを取得
+        documents = page["documents"]
+        while page["next_token"]:
+            page = list_s3_documents("my-bucket", continuation_token=page["next_token"])
+            documents.extend(page["documents"])
+        
+        # 特定のプレフィックスのドキュメントのみを取得（最初のページ）
         list_s3_documents("my-bucket", "documents/")
+        
+        # フォルダごとに並列ですべてのドキュメントを取得
+        list_s3_documents("my-bucket", "documents/", parallel=True)
+        
+        # 100件ずつ取得（2ページ目以降は前回のnext_tokenを指定）
+        page = list_s3_documents("my-bucket", max_results=100)
+        list_s3_documents("my-bucket", max_results=100, continuation_token=page["next_token"])
+    
+    Note:
+        parallel=Falseの場合、max_resultsを指定しない呼び出しも最初の1000件までしか返しません。
+        すべてのドキュメントが必要な場合は、next_tokenがNoneになるまでcontinuation_tokenを指定して
+        呼び出しを繰り返してください。以前のバージョンのようにbucket_nameのみを指定した呼び出しでは、
+        1000件を超えるバケットの一部しか返されません。
     """
     # 入力値のバリデーション（共通関数を使用）
     bucket_name = validate_required_string(bucket_name, "bucket_name")
@@ -1003,22 +1397,138 @@ def list_s3_documents(bucket_name: str, prefix: str = "") -> S3DocumentListRespo
     # プレフィックスはオプションなので、指定されている場合のみstripを適用
     prefix_cleaned = prefix.strip() if prefix else ""
     
+    token_cleaned = continuation_token.strip() if continuation_token else ""
+    
     # BedrockクライアントからS3ドキュメント一覧を取得
-    documents = bedrock_client.list_s3_documents(
-        bucket_name,  # 前後の空白は既に削除済み
-        prefix_cleaned
-    )
+    next_token = None
+    if parallel:
+        # 並列取得ではフォルダごとに独立してページネーションするため、続きのトークンは使用できません
+        if token_cleaned:
+            raise ValueError("continuation_token cannot be used with parallel=True")
+        # プレフィックス直下のフォルダを自動検出し、フォルダごとに並列取得
+        documents = await asyncio.to_thread(
+            get_default_client().list_s3_documents_parallel,
+            bucket_name,  # 前後の空白は既に削除済み
+            prefix=prefix_cleaned,
+        )
+    else:
+        # max_resultsは1から10000の範囲で指定する必要があります
+        if not (1 <= max_results <= 10000):
+            raise ValueError("max_results must be between 1 and 10000")
+        # 最大max_results件のみを取得し、続きがある場合はnext_tokenを返します
+        documents, next_token = await asyncio.to_thread(
+            get_default_client().list_s3_documents_page,
+            bucket_name,  # 前後の空白は既に削除済み
+            prefix_cleaned,
+            max_results,
+            token_cleaned or None,
+        )
     return {
         "count": len(documents),
         "bucket": bucket_name,  # 前後の空白は既に削除済み
         "prefix": prefix_cleaned,
         "documents": documents,
+        "next_token": next_token,
     }
 
 
+def _raise_invalid_bucket_name(bucket_name: str) -> NoReturn:
+    """
+    無効なS3バケット名について、違反しているルールに応じたValueErrorを送出します。
+    
+    _BUCKET_VALIDATE_REに一致しなかった場合にのみ呼び出されるため、
+    ここでの個別のチェックは有効なバケット名の検証コストには影響しません。
+    
+    Args:
+        bucket_name: _BUCKET_VALIDATE_REに一致しなかったバケット名
+    
+    Raises:
+        ValueError: 常に送出されます（違反しているルールを示すメッセージ付き）
+    """
+    # バケット名の長さは3-63文字
+    if not (3 <= len(bucket_name) <= 63):
+        raise ValueError("bucket_name must be between 3 and 63 characters")
+    
+    # バケット名は小文字、数字、ハイフン、ピリオドのみ使用可能
+    if not _BUCKET_NAME_RE.match(bucket_name):
+        raise ValueError(
+            "bucket_name must start and end with a lowercase letter or number, "
+            "and contain only lowercase letters, numbers, hyphens, and periods"
+        )
+    
+    # 連続するハイフンやピリオドは使用不可
+    if '..' in bucket_name or '--' in bucket_name:
+        raise ValueError("bucket_name cannot contain consecutive periods or hyphens")
+    
+    # 残りはIPアドレス形式の場合です（簡易版のチェック）
+    # より厳密なチェックが必要な場合は、ipaddressモジュールを使用できます
+    raise ValueError("bucket_name cannot be in IP address format")
+
+
+def _validate_bucket_name(bucket_name: str) -> str:
+    """
+    S3バケット名を検証し、前後の空白を削除した値を返します。
+    
+    create_s3_bucketとsetup_kb_infrastructureで共通して使用します。
+    
+    Args:
+        bucket_name: 検証するS3バケット名
+    
+    Returns:
+        str: 前後の空白を削除したバケット名
+    
+    Raises:
+        ValueError: bucket_nameが空の場合、またはバケット名が無効な形式の場合
+    """
+    bucket_name = validate_required_string(bucket_name, "bucket_name")
+    
+    # AWS S3のバケット名ルールに従う必要があります
+    # 有効な名前は_BUCKET_VALIDATE_REの1回の照合で検証し、無効な場合のみ理由を特定します
+    if not _BUCKET_VALIDATE_RE.match(bucket_name):
+        _raise_invalid_bucket_name(bucket_name)
+    return bucket_name
+
+
+def _validate_role_params(role_name: str, max_session_duration: int) -> str:
+    """
+    IAMロール名と最大セッション時間を検証し、前後の空白を削除したロール名を返します。
+    
+    create_bedrock_kb_roleとsetup_kb_infrastructureで共通して使用します。
+    
+    Args:
+        role_name: 検証するIAMロール名
+        max_session_duration: 最大セッション時間（秒）
+    
+    Returns:
+        str: 前後の空白を削除したロール名
+    
+    Raises:
+        ValueError: role_nameが空・無効な形式の場合、またはmax_session_durationが範囲外の場合
+    """
+    role_name = validate_required_string(role_name, "role_name")
+    
+    # ロール名の基本的なバリデーション
+    # IAMロール名のルールに従う必要があります
+    if not (1 <= len(role_name) <= 64):
+        raise ValueError("role_name must be between 1 and 64 characters")
+    
+    # ロール名は英数字、ハイフン、アンダースコア、ピリオドのみ使用可能
+    if role_name.translate(_IAM_ROLE_NAME_STRIP_TABLE):
+        raise ValueError(
+            "role_name must contain only alphanumeric characters, hyphens, "
+            "underscores, periods, plus signs, equals signs, commas, and @ symbols"
+        )
+    
+    # max_session_durationのバリデーション
+    # IAMの制限: 3600秒（1時間）から43200秒（12時間）まで
+    if not (3600 <= max_session_duration <= 43200):
+        raise ValueError("max_session_duration must be between 3600 and 43200 seconds")
+    return role_name
+
+
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def create_s3_bucket(
+async def create_s3_bucket(
     bucket_name: str,
     region: str = "us-east-1",
 ) -> S3BucketCreateResponseDict:
@@ -1066,38 +1576,16 @@ def create_s3_bucket(
         - バケット名が既に使用されている場合、BucketAlreadyOwnedByYouまたはBucketAlreadyExistsエラーが発生します
         - パブリックアクセスブロック設定は、バケット作成後に自動的に適用されます
     """
-    # 入力値のバリデーション（共通関数を使用）
-    bucket_name = validate_required_string(bucket_name, "bucket_name")
-    
-    # バケット名の基本的なバリデーション
-    # AWS S3のバケット名ルールに従う必要があります
-    if len(bucket_name) < 3 or len(bucket_name) > 63:
-        raise ValueError("bucket_name must be between 3 and 63 characters")
-    
-    # バケット名は小文字、数字、ハイフン、ピリオドのみ使用可能
-    # ただし、IPアドレス形式は使用不可
-    import re
-    if not re.match(r'^[a-z0-9][a-z0-9.-]*[a-z0-9]$', bucket_name):
-        raise ValueError(
-            "bucket_name must start and end with a lowercase letter or number, "
-            "and contain only lowercase letters, numbers, hyphens, and periods"
-        )
-    
-    # 連続するハイフンやピリオドは使用不可
-    if '..' in bucket_name or '--' in bucket_name:
-        raise ValueError("bucket_name cannot contain consecutive periods or hyphens")
-    
-    # IPアドレス形式のチェック（簡易版）
-    # より厳密なチェックが必要な場合は、ipaddressモジュールを使用できます
-    ip_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-    if re.match(ip_pattern, bucket_name):
-        raise ValueError("bucket_name cannot be in IP address format")
+    # 入力値のバリデーション（バケット名のルールも含めて検証）
+    bucket_name = _validate_bucket_name(bucket_name)
     
     # リージョンを正規化（前後の空白を削除、空文字列の場合はus-east-1を使用）
     region_cleaned = region.strip() if region else "us-east-1"
     
     # BedrockクライアントからS3バケットを作成
-    result = bedrock_client.create_s3_bucket(
+    # API呼び出しはワーカースレッドで実行し、イベントループをブロックしません
+    result = await asyncio.to_thread(
+        get_default_client().create_s3_bucket,
         bucket_name=bucket_name,  # 前後の空白は既に削除済み
         region=region_cleaned,  # 既定値はus-east-1
     )
@@ -1106,7 +1594,7 @@ def create_s3_bucket(
 
 @mcp.tool()  # MCPツールとして公開
 @handle_errors  # エラーハンドリングデコレータを適用
-def create_bedrock_kb_role(
+async def create_bedrock_kb_role(
     role_name: str,
     region: str = "us-east-1",
     description: str = "Bedrock Knowledge Base access",
@@ -1166,32 +1654,16 @@ def create_bedrock_kb_role(
         - ロール作成後、適切な権限ポリシーをアタッチする必要があります
         - ロール名が既に使用されている場合、EntityAlreadyExistsエラーが発生します
     """
-    # 入力値のバリデーション（共通関数を使用）
-    role_name = validate_required_string(role_name, "role_name")
-    
-    # ロール名の基本的なバリデーション
-    # IAMロール名のルールに従う必要があります
-    if len(role_name) < 1 or len(role_name) > 64:
-        raise ValueError("role_name must be between 1 and 64 characters")
-    
-    # ロール名は英数字、ハイフン、アンダースコア、ピリオドのみ使用可能
-    import re
-    if not re.match(r'^[\w+=,.@-]+$', role_name):
-        raise ValueError(
-            "role_name must contain only alphanumeric characters, hyphens, "
-            "underscores, periods, plus signs, equals signs, commas, and @ symbols"
-        )
-    
-    # max_session_durationのバリデーション
-    # IAMの制限: 3600秒（1時間）から43200秒（12時間）まで
-    if max_session_duration < 3600 or max_session_duration > 43200:
-        raise ValueError("max_session_duration must be between 3600 and 43200 seconds")
+    # 入力値のバリデーション（ロール名のルールとセッション時間の範囲も含めて検証）
+    role_name = _validate_role_params(role_name, max_session_duration)
     
     # リージョンを正規化（前後の空白を削除、空文字列の場合はus-east-1を使用）
     region_cleaned = region.strip() if region else "us-east-1"
     
     # BedrockクライアントからIAMロールを作成
-    result = bedrock_client.create_bedrock_kb_role(
+    # API呼び出し（STSによるアカウントIDの取得を含む）はワーカースレッドで実行し、イベントループをブロックしません
+    result = await asyncio.to_thread(
+        get_default_client().create_bedrock_kb_role,
         role_name=role_name,  # 前後の空白は既に削除済み
         region=region_cleaned,  # 既定値はus-east-1
         description=description,
@@ -1200,6 +1672,103 @@ def create_bedrock_kb_role(
     return result
 
 
+@mcp.tool()  # MCPツールとして公開
+@handle_errors  # エラーハンドリングデコレータを適用
+async def setup_kb_infrastructure(
+    bucket_name: str,
+    role_name: str,
+    region: str = "us-east-1",
+    description: str = "Bedrock Knowledge Base access",
+    max_session_duration: int = 3600,
+) -> KBInfrastructureResponseDict:
+    """
+    Knowledge Base用のS3バケットとIAMサービスロールを1回の呼び出しで作成します。
+    
+    create_s3_bucketとcreate_bedrock_kb_roleは互いに独立しているため、
+    両方の作成を並列に実行します。Knowledge Baseのセットアップ時に2つのツールを
+    続けて呼び出す場合と比べて、MCPの往復が1回で済み、待ち時間も短くなります。
+    バケットとロールの作成内容は、それぞれのツールと同じです。
+
+    Args:
+        bucket_name: 作成するS3バケット名（必須、create_s3_bucketと同じルール）
+            例: "my-documents-bucket"
+        role_name: 作成するIAMロールの名前（必須）
+            例: "BedrockKnowledgeBaseRole"
+        region: バケットとKnowledge Baseのリージョン（デフォルト: "us-east-1"）
+            バケットの作成先と、信頼ポリシーのaws:SourceArnの両方に使用されます
+        description: ロールの説明（デフォルト: "Bedrock Knowledge Base access"）
+        max_session_duration: 最大セッション時間（秒）（デフォルト: 3600秒 = 1時間）
+            範囲: 3600秒（1時間）から43200秒（12時間）まで
+
+    Returns:
+        KBInfrastructureResponseDict: 作成結果
+            - bucket: バケット作成結果（create_s3_bucketと同じ形式）
+            - role: ロール作成結果（create_bedrock_kb_roleと同じ形式）
+    
+    Raises:
+        ValueError: bucket_nameまたはrole_nameが無効な場合、max_session_durationが範囲外の場合
+        ClientError: いずれかのAWS API呼び出しが失敗した場合
+    
+    Example:
+        setup_kb_infrastructure(
+            "my-documents-bucket",
+            "BedrockKnowledgeBaseRole",
+            region="ap-northeast-1"
+        )
+    
+    Note:
+        - 入力値はAWS APIを呼び出す前にすべて検証されるため、
+          入力値が無効な場合はどちらのリソースも作成されません
+        - 一方の作成のみが失敗した場合、もう一方で作成されたリソースは残ります
+          （エラーを返す前に、作成済みのリソースをログに記録します）
+    """
+    # 入力値のバリデーション（どちらかが無効な場合は何も作成しません）
+    bucket_name = _validate_bucket_name(bucket_name)
+    role_name = _validate_role_params(role_name, max_session_duration)
+    
+    # リージョンを正規化（前後の空白を削除、空文字列の場合はus-east-1を使用）
+    region_cleaned = region.strip() if region else "us-east-1"
+    
+    # バケットとロールの作成は互いに独立しているため、ワーカースレッドで並列に実行します
+    # to_threadで実行中の処理は途中で取り消せないため、return_exceptions=Trueで両方の完了を待ちます
+    client = get_default_client()
+    bucket_result, role_result = await asyncio.gather(
+        asyncio.to_thread(
+            client.create_s3_bucket,
+            bucket_name=bucket_name,
+            region=region_cleaned,
+        ),
+        asyncio.to_thread(
+            client.create_bedrock_kb_role,
+            role_name=role_name,
+            region=region_cleaned,
+            description=description,
+            max_session_duration=max_session_duration,
+        ),
+        return_exceptions=True,
+    )
+    
+    # 一方のみが失敗した場合は、作成済みのリソースを記録してから最初のエラーを送出します
+    if isinstance(bucket_result, BaseException):
+        if not isinstance(role_result, BaseException):
+            logger.warning(
+                "Bucket creation failed; IAM role %s was created and left in place",
+                role_name,
+            )
+        raise bucket_result
+    if isinstance(role_result, BaseException):
+        logger.warning(
+            "IAM role creation failed; S3 bucket %s was created and left in place",
+            bucket_name,
+        )
+        raise role_result
+    
+    return {
+        "bucket": bucket_result,
+        "role": role_result,
+    }
+
+
 def main():
     """
     MCPサーバーを起動します。
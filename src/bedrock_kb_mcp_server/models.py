@@ -11,10 +11,22 @@ Pydanticモデルを定義します。
 - IDEの自動補完サポート
 """
 
+import re
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from bedrock_kb_mcp_server.utils import (
+    _S3_BUCKET_NAME_PATTERN,
+    normalize_iam_role_arn,
+    normalize_s3_arn_or_uri,
+)
+
+# S3バケットARN（arn:aws:s3:::bucket-name、オプションでパスを含む）のパターン
+# バケット名はS3 URI（normalize_s3_arn_or_uri）と同じ規則（_S3_BUCKET_NAME_PATTERN）で検証します
+# バリデーションのたびにコンパイルしないよう、モジュール読み込み時にコンパイルします
+_S3_BUCKET_ARN_RE = re.compile(rf"^arn:aws:s3:::{_S3_BUCKET_NAME_PATTERN}(/.*)?$")
 
 
 class StorageType(str, Enum):
@@ -132,6 +144,30 @@ class DataSourceResponse(BaseModel):
     status: str  # データソースのステータス
 
 
+class IngestionStatistics(BaseModel):
+    """
+    取り込みジョブの統計情報モデル
+    
+    フィールド名はAWS APIのIngestionJobStatisticsのキーと同じです。
+    
+    Attributes:
+        numberOfDocumentsScanned: スキャンされたドキュメント数
+        numberOfMetadataDocumentsScanned: スキャンされたメタデータドキュメント数
+        numberOfNewDocumentsIndexed: 新規にインデックスされたドキュメント数
+        numberOfModifiedDocumentsIndexed: 変更されてインデックスされたドキュメント数
+        numberOfMetadataDocumentsModified: 変更されたメタデータドキュメント数
+        numberOfDocumentsDeleted: 削除されたドキュメント数
+        numberOfDocumentsFailed: 失敗したドキュメント数
+    """
+    numberOfDocumentsScanned: int = 0
+    numberOfMetadataDocumentsScanned: int = 0
+    numberOfNewDocumentsIndexed: int = 0
+    numberOfModifiedDocumentsIndexed: int = 0
+    numberOfMetadataDocumentsModified: int = 0
+    numberOfDocumentsDeleted: int = 0
+    numberOfDocumentsFailed: int = 0
+
+
 class IngestionJobResponse(BaseModel):
     """
     取り込みジョブのレスポンスモデル
@@ -146,14 +182,11 @@ class IngestionJobResponse(BaseModel):
             - "COMPLETE": ジョブが完了
             - "FAILED": ジョブが失敗
         statistics: 統計情報（オプション、ジョブが進行中または完了している場合）
-            - numberOfDocumentsScanned: スキャンされたドキュメント数
-            - numberOfDocumentsModified: 変更されたドキュメント数
-            - numberOfDocumentsDeleted: 削除されたドキュメント数
-            - numberOfDocumentsFailed: 失敗したドキュメント数
+            各項目についてはIngestionStatisticsを参照してください
     """
     ingestion_job_id: str  # 取り込みジョブのID
     status: str  # ジョブのステータス
-    statistics: Optional[Dict[str, Any]] = None  # 統計情報（オプション）
+    statistics: Optional[IngestionStatistics] = None  # 統計情報（オプション）
 
 
 class S3UploadResponse(BaseModel):
@@ -170,6 +203,24 @@ class S3UploadResponse(BaseModel):
     status: str  # アップロードステータス
 
 
+class RetrieveResult(BaseModel):
+    """
+    RAGクエリの検索結果1件のモデル
+    
+    フィールド名はAWS APIのKnowledgeBaseRetrievalResultのキーと同じです。
+    
+    Attributes:
+        content: ドキュメントの内容（type、textなど）
+        location: ドキュメントの場所（type、s3Locationなど）
+        score: 関連度スコア（高いほど関連性が高い）
+        metadata: メタデータ（ドキュメントの種類、作成日時など）
+    """
+    content: Dict[str, Any]  # ドキュメントの内容
+    location: Optional[Dict[str, Any]] = None  # ドキュメントの場所
+    score: Optional[float] = None  # 関連度スコア
+    metadata: Optional[Dict[str, Any]] = None  # メタデータ
+
+
 class RetrieveResponse(BaseModel):
     """
     RAGクエリのレスポンスモデル
@@ -178,14 +229,10 @@ class RetrieveResponse(BaseModel):
     
     Attributes:
         results: 検索結果のリスト
-            各結果には以下の情報が含まれます:
-            - content: ドキュメントの内容（テキスト）
-            - location: ドキュメントの場所（S3 URIなど）
-            - score: 関連度スコア（0.0-1.0の範囲、高いほど関連性が高い）
-            - metadata: メタデータ（ドキュメントの種類、作成日時など）
+            各結果の項目についてはRetrieveResultを参照してください
         query: 実行したクエリテキスト
     """
-    results: List[Dict[str, Any]]  # 検索結果のリスト
+    results: List[RetrieveResult]  # 検索結果のリスト
     query: str  # 実行したクエリテキスト
 
 
@@ -215,6 +262,10 @@ class ParsingConfiguration(BaseModel):
         parsing_modality: マルチモーダルデータのパーシングを有効にするか（MULTIMODAL）
         parsing_prompt_text: パーシングプロンプトのテキスト（オプション）
     """
+    # 構築後に変更されない設定のため、イミュータブルにします
+    # main._build_vector_ingestion_configがキャッシュしたインスタンスを共有しても安全です
+    model_config = ConfigDict(frozen=True)
+    
     parsing_strategy: ParsingStrategy = Field(..., description="パーシング戦略")
     parsing_model_arn: Optional[str] = Field(default=None, description="Foundation ModelのARN")
     parsing_modality: Optional[str] = Field(default=None, description="マルチモーダル設定（MULTIMODAL）")
@@ -247,6 +298,10 @@ class ChunkingConfiguration(BaseModel):
         buffer_size: バッファサイズ（SEMANTICの場合）
         breakpoint_percentile_threshold: ブレークポイントのパーセンタイル閾値（SEMANTICの場合）
     """
+    # 構築後に変更されない設定のため、イミュータブルにします
+    # main._build_vector_ingestion_configがキャッシュしたインスタンスを共有しても安全です
+    model_config = ConfigDict(frozen=True)
+    
     chunking_strategy: ChunkingStrategy = Field(..., description="チャンキング戦略")
     max_tokens: Optional[int] = Field(default=None, description="最大トークン数")
     overlap_percentage: Optional[int] = Field(default=None, ge=0, le=100, description="オーバーラップ率（0-100）")
@@ -256,6 +311,74 @@ class ChunkingConfiguration(BaseModel):
     breakpoint_percentile_threshold: Optional[int] = Field(default=None, description="ブレークポイントのパーセンタイル閾値（セマンティックチャンキング用）")
 
 
+# 戦略ごとのAWS API形式の追加設定を構築する関数
+# 各関数は、parsingConfiguration/chunkingConfigurationに追加するキーと値の辞書を返します
+# to_api_dictでif/elifの連鎖を評価せずに済むよう、戦略から関数への対応表をモジュール読み込み時に作成します
+
+def _build_foundation_model_parsing(cfg: ParsingConfiguration) -> Dict[str, Any]:
+    """BEDROCK_FOUNDATION_MODEL戦略の追加設定を構築します。"""
+    foundation_config: Dict[str, Any] = {"modelArn": cfg.parsing_model_arn}
+    if cfg.parsing_modality:
+        foundation_config["parsingModality"] = cfg.parsing_modality
+    if cfg.parsing_prompt_text:
+        foundation_config["parsingPrompt"] = {"parsingPromptText": cfg.parsing_prompt_text}
+    return {"bedrockFoundationModelConfiguration": foundation_config}
+
+
+def _build_data_automation_parsing(cfg: ParsingConfiguration) -> Dict[str, Any]:
+    """BEDROCK_DATA_AUTOMATION戦略の追加設定を構築します。"""
+    automation_config: Dict[str, Any] = {}
+    if cfg.parsing_modality:
+        automation_config["parsingModality"] = cfg.parsing_modality
+    return {"bedrockDataAutomationConfiguration": automation_config}
+
+
+def _build_fixed_size_chunking(cfg: ChunkingConfiguration) -> Dict[str, Any]:
+    """FIXED_SIZE戦略の追加設定を構築します（max_tokens未指定の場合は追加設定なし）。"""
+    if cfg.max_tokens is None:
+        return {}
+    return {
+        "fixedSizeChunkingConfiguration": {
+            "maxTokens": cfg.max_tokens,
+            "overlapPercentage": cfg.overlap_percentage or 0,
+        }
+    }
+
+
+def _build_hierarchical_chunking(cfg: ChunkingConfiguration) -> Dict[str, Any]:
+    """HIERARCHICAL戦略の追加設定を構築します。"""
+    hierarchical_config: Dict[str, Any] = {}
+    if cfg.level_configurations:
+        hierarchical_config["levelConfigurations"] = cfg.level_configurations
+    if cfg.overlap_tokens is not None:
+        hierarchical_config["overlapTokens"] = cfg.overlap_tokens
+    return {"hierarchicalChunkingConfiguration": hierarchical_config}
+
+
+def _build_semantic_chunking(cfg: ChunkingConfiguration) -> Dict[str, Any]:
+    """SEMANTIC戦略の追加設定を構築します。"""
+    semantic_config: Dict[str, Any] = {}
+    if cfg.max_tokens is not None:
+        semantic_config["maxTokens"] = cfg.max_tokens
+    if cfg.buffer_size is not None:
+        semantic_config["bufferSize"] = cfg.buffer_size
+    if cfg.breakpoint_percentile_threshold is not None:
+        semantic_config["breakpointPercentileThreshold"] = cfg.breakpoint_percentile_threshold
+    return {"semanticChunkingConfiguration": semantic_config}
+
+
+_PARSING_BUILDERS: Dict[ParsingStrategy, Callable[[ParsingConfiguration], Dict[str, Any]]] = {
+    ParsingStrategy.BEDROCK_FOUNDATION_MODEL: _build_foundation_model_parsing,
+    ParsingStrategy.BEDROCK_DATA_AUTOMATION: _build_data_automation_parsing,
+}
+
+_CHUNKING_BUILDERS: Dict[ChunkingStrategy, Callable[[ChunkingConfiguration], Dict[str, Any]]] = {
+    ChunkingStrategy.FIXED_SIZE: _build_fixed_size_chunking,
+    ChunkingStrategy.HIERARCHICAL: _build_hierarchical_chunking,
+    ChunkingStrategy.SEMANTIC: _build_semantic_chunking,
+}
+
+
 class VectorIngestionConfiguration(BaseModel):
     """
     ベクトル取り込み設定モデル
@@ -266,6 +389,10 @@ class VectorIngestionConfiguration(BaseModel):
         parsing_configuration: パーシング設定（オプション）
         chunking_configuration: チャンキング設定（オプション）
     """
+    # 構築後に変更されない設定のため、イミュータブルにします
+    # main._build_vector_ingestion_configがキャッシュしたインスタンスを共有しても安全です
+    model_config = ConfigDict(frozen=True)
+    
     parsing_configuration: Optional[ParsingConfiguration] = Field(default=None, description="パーシング設定")
     chunking_configuration: Optional[ChunkingConfiguration] = Field(default=None, description="チャンキング設定")
     
@@ -279,59 +406,23 @@ class VectorIngestionConfiguration(BaseModel):
         result: Dict[str, Any] = {}
         
         # パーシング設定を追加
-        if self.parsing_configuration:
-            parsing_config = {
-                "parsingStrategy": self.parsing_configuration.parsing_strategy.value
-            }
-            
-            if self.parsing_configuration.parsing_strategy == ParsingStrategy.BEDROCK_FOUNDATION_MODEL:
-                foundation_config: Dict[str, Any] = {
-                    "modelArn": self.parsing_configuration.parsing_model_arn
-                }
-                if self.parsing_configuration.parsing_modality:
-                    foundation_config["parsingModality"] = self.parsing_configuration.parsing_modality
-                if self.parsing_configuration.parsing_prompt_text:
-                    foundation_config["parsingPrompt"] = {
-                        "parsingPromptText": self.parsing_configuration.parsing_prompt_text
-                    }
-                parsing_config["bedrockFoundationModelConfiguration"] = foundation_config
-            elif self.parsing_configuration.parsing_strategy == ParsingStrategy.BEDROCK_DATA_AUTOMATION:
-                automation_config: Dict[str, Any] = {}
-                if self.parsing_configuration.parsing_modality:
-                    automation_config["parsingModality"] = self.parsing_configuration.parsing_modality
-                parsing_config["bedrockDataAutomationConfiguration"] = automation_config
-            
+        # 戦略ごとの追加設定は_PARSING_BUILDERSから1回の参照で取得します
+        parsing = self.parsing_configuration
+        if parsing:
+            parsing_config = {"parsingStrategy": parsing.parsing_strategy.value}
+            parsing_builder = _PARSING_BUILDERS.get(parsing.parsing_strategy)
+            if parsing_builder is not None:
+                parsing_config.update(parsing_builder(parsing))
             result["parsingConfiguration"] = parsing_config
         
         # チャンキング設定を追加
-        if self.chunking_configuration:
-            chunking_config = {
-                "chunkingStrategy": self.chunking_configuration.chunking_strategy.value
-            }
-            
-            if self.chunking_configuration.chunking_strategy == ChunkingStrategy.FIXED_SIZE:
-                if self.chunking_configuration.max_tokens is not None:
-                    chunking_config["fixedSizeChunkingConfiguration"] = {
-                        "maxTokens": self.chunking_configuration.max_tokens,
-                        "overlapPercentage": self.chunking_configuration.overlap_percentage or 0
-                    }
-            elif self.chunking_configuration.chunking_strategy == ChunkingStrategy.HIERARCHICAL:
-                hierarchical_config: Dict[str, Any] = {}
-                if self.chunking_configuration.level_configurations:
-                    hierarchical_config["levelConfigurations"] = self.chunking_configuration.level_configurations
-                if self.chunking_configuration.overlap_tokens is not None:
-                    hierarchical_config["overlapTokens"] = self.chunking_configuration.overlap_tokens
-                chunking_config["hierarchicalChunkingConfiguration"] = hierarchical_config
-            elif self.chunking_configuration.chunking_strategy == ChunkingStrategy.SEMANTIC:
-                semantic_config: Dict[str, Any] = {}
-                if self.chunking_configuration.max_tokens is not None:
-                    semantic_config["maxTokens"] = self.chunking_configuration.max_tokens
-                if self.chunking_configuration.buffer_size is not None:
-                    semantic_config["bufferSize"] = self.chunking_configuration.buffer_size
-                if self.chunking_configuration.breakpoint_percentile_threshold is not None:
-                    semantic_config["breakpointPercentileThreshold"] = self.chunking_configuration.breakpoint_percentile_threshold
-                chunking_config["semanticChunkingConfiguration"] = semantic_config
-            
+        # 戦略ごとの追加設定は_CHUNKING_BUILDERSから1回の参照で取得します（NONEは追加設定なし）
+        chunking = self.chunking_configuration
+        if chunking:
+            chunking_config = {"chunkingStrategy": chunking.chunking_strategy.value}
+            chunking_builder = _CHUNKING_BUILDERS.get(chunking.chunking_strategy)
+            if chunking_builder is not None:
+                chunking_config.update(chunking_builder(chunking))
             result["chunkingConfiguration"] = chunking_config
         
         return result
@@ -408,7 +499,6 @@ class CreateKnowledgeBaseRequest(BaseModel):
         Raises:
             ValueError: ARN形式が無効な場合
         """
-        from bedrock_kb_mcp_server.utils import normalize_iam_role_arn
         return normalize_iam_role_arn(v)
     
     @field_validator('bucket_arn')
@@ -426,7 +516,7 @@ class CreateKnowledgeBaseRequest(BaseModel):
         Raises:
             ValueError: ARN形式が無効な場合
         """
-        if not v.startswith('arn:aws:s3:::'):
+        if not _S3_BUCKET_ARN_RE.match(v):
             raise ValueError('Invalid S3 bucket ARN format')
         return v
 
@@ -481,6 +571,5 @@ class CreateDataSourceRequest(BaseModel):
         Raises:
             ValueError: ARN形式またはURI形式が無効な場合
         """
-        from bedrock_kb_mcp_server.utils import normalize_s3_arn_or_uri
         return normalize_s3_arn_or_uri(v)
 
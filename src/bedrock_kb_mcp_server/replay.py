@@ -0,0 +1,192 @@
+"""
+AWS APIレスポンスの記録・再生（record/replay）モジュール
+
+テストや開発時に実際のAWS APIを呼び出さずに動作を確認するための仕組みを提供します。
+環境変数で有効化した場合のみ動作し、通常の実行（本番環境）には影響しません。
+
+- 記録モード（BEDROCK_KB_RECORD）: 実際のAPIレスポンスをJSONフィクスチャとして保存します
+- 再生モード（BEDROCK_KB_REPLAY）: 保存したフィクスチャを`botocore.stub.Stubber`で返し、
+  ネットワークにアクセスせずにAPI呼び出しを完結させます
+
+フィクスチャはサービスごとに1つのJSON Linesファイル（例: `bedrock-agent-runtime.jsonl`）として保存され、
+API呼び出しの順序どおりに1行ずつ`{"operation": ..., "response": ...}`
+（エラーの場合は`{"operation": ..., "error": ..., "http_status_code": ...}`）を格納します。
+記録時は1回のAPI呼び出しごとに1行を追記するため、記録済みのエントリを書き直すことはありません。
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+from botocore import xform_name
+from botocore.stub import Stubber
+
+# 有効化を判定する環境変数の値は、setup_loggingと同じ定義を共有します
+from bedrock_kb_mcp_server.utils import _TRUE_VALUES
+
+# このモジュール用のロガーを取得
+logger = logging.getLogger(__name__)
+
+# このプロセスで記録を開始したサービス名
+# 同じサービスのクライアントが複数作成されても、1つのファイルにまとめて記録します
+# （ファイルは最初のクライアントの作成時に空にし、以降は追記のみ行います）
+_recording_services: Set[str] = set()
+# フィクスチャへの追記を保護するロック（1行の書き込みの間のみ保持します）
+_record_lock = threading.Lock()
+
+
+def _env_enabled(name: str) -> bool:
+    """
+    環境変数が有効（"1", "true"など）に設定されているかを判定します。
+
+    Args:
+        name: 環境変数名
+
+    Returns:
+        bool: 有効な値が設定されている場合はTrue
+    """
+    return os.getenv(name, "").strip().lower() in _TRUE_VALUES
+
+
+def _fixtures_dir() -> Path:
+    """
+    フィクスチャを保存・読み込みするディレクトリを取得します。
+
+    Returns:
+        Path: 環境変数BEDROCK_KB_FIXTURES_DIRのパス（デフォルト: ./fixtures）
+    """
+    return Path(os.getenv("BEDROCK_KB_FIXTURES_DIR", "fixtures"))
+
+
+def _fixture_path(service_name: str) -> Path:
+    """
+    サービスのフィクスチャファイルのパスを取得します。
+
+    Args:
+        service_name: AWSサービス名
+
+    Returns:
+        Path: フィクスチャファイルのパス（例: ./fixtures/bedrock-agent-runtime.jsonl）
+    """
+    return _fixtures_dir() / f"{service_name}.jsonl"
+
+
+def _json_default(value: Any) -> Any:
+    """
+    json.dumpsで直接シリアライズできない値を変換します。
+
+    Args:
+        value: 変換する値
+
+    Returns:
+        Any: datetimeの場合はISO形式の文字列、それ以外は文字列表現
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _install_stubber(client: Any, service_name: str) -> None:
+    """
+    フィクスチャを読み込んだStubberをクライアントに設定します（再生モード）。
+
+    Args:
+        client: boto3クライアント
+        service_name: AWSサービス名（フィクスチャファイル名に使用）
+    """
+    path = _fixture_path(service_name)
+    entries: List[Dict[str, Any]] = []
+    if path.exists():
+        lines = path.read_text(encoding="utf-8").splitlines()
+        entries = [json.loads(line) for line in lines if line.strip()]
+
+    # Stubberは登録した順にレスポンスを返します
+    # 操作名はAPI名（例: "Retrieve"）からメソッド名（例: "retrieve"）に変換して登録します
+    # エラーとして記録されたエントリは、同じエラーコードのClientErrorとして再生します
+    stubber = Stubber(client)
+    for entry in entries:
+        method_name = xform_name(entry["operation"])
+        if "error" in entry:
+            stubber.add_client_error(
+                method_name,
+                service_error_code=entry["error"].get("Code", ""),
+                service_message=entry["error"].get("Message", ""),
+                http_status_code=entry.get("http_status_code", 400),
+            )
+        else:
+            stubber.add_response(method_name, entry["response"])
+    stubber.activate()
+
+    # Stubberがガベージコレクションされないよう、クライアントに保持させます
+    client._bedrock_kb_stubber = stubber
+    logger.info("Replaying %d recorded responses for %s from %s", len(entries), service_name, path)
+
+
+def _install_recorder(client: Any, service_name: str) -> None:
+    """
+    APIレスポンスをフィクスチャとして保存するハンドラーを登録します（記録モード）。
+
+    Args:
+        client: boto3クライアント
+        service_name: AWSサービス名（フィクスチャファイル名に使用）
+    """
+    path = _fixture_path(service_name)
+    with _record_lock:
+        if service_name not in _recording_services:
+            # 以前の実行で記録したファイルは、このプロセスの記録で置き換えます
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("", encoding="utf-8")
+            _recording_services.add(service_name)
+
+    def _record(
+        http_response: Any, parsed: Dict[str, Any], model: Any, **kwargs: Any
+    ) -> None:
+        if "Error" in parsed:
+            # エラーレスポンスは、エラーコードとHTTPステータスコードのみを記録します
+            entry = {
+                "operation": model.name,
+                "error": parsed["Error"],
+                "http_status_code": http_response.status_code,
+            }
+        else:
+            # リクエストIDなどの可変情報は再生時に不要なため除外します
+            response = {k: v for k, v in parsed.items() if k != "ResponseMetadata"}
+            entry = {"operation": model.name, "response": response}
+        # シリアライズはロックの外で行い、ロックは1行の追記の間のみ保持します
+        line = json.dumps(entry, ensure_ascii=False, default=_json_default) + "\n"
+        with _record_lock:
+            with path.open("a", encoding="utf-8") as f:
+                f.write(line)
+
+    client.meta.events.register("after-call", _record)
+    logger.info("Recording responses for %s to %s", service_name, path)
+
+
+def instrument_client(client: Any, service_name: str) -> Any:
+    """
+    環境変数に応じて、クライアントに記録または再生の仕組みを設定します。
+
+    どちらの環境変数も設定されていない場合は、クライアントをそのまま返します。
+    両方が設定されている場合は、再生モードが優先されます。
+
+    Args:
+        client: boto3クライアント
+        service_name: AWSサービス名（例: "bedrock-agent", "s3"）
+
+    Returns:
+        Any: 渡されたクライアント（同じオブジェクト）
+
+    Environment Variables:
+        BEDROCK_KB_REPLAY: "1"などに設定すると、フィクスチャからレスポンスを再生します
+        BEDROCK_KB_RECORD: "1"などに設定すると、実際のAPIレスポンスをフィクスチャに記録します
+        BEDROCK_KB_FIXTURES_DIR: フィクスチャのディレクトリ（デフォルト: ./fixtures）
+    """
+    if _env_enabled("BEDROCK_KB_REPLAY"):
+        _install_stubber(client, service_name)
+    elif _env_enabled("BEDROCK_KB_RECORD"):
+        _install_recorder(client, service_name)
+    return client
@@ -42,19 +42,56 @@ class DataSourceListResponseDict(TypedDict):
     data_sources: List[Dict[str, Any]]
 
 
+class IngestionJobStatisticsDict(TypedDict, total=False):
+    """取り込みジョブの統計情報の型（AWS APIのIngestionJobStatisticsと同じキー）"""
+    numberOfDocumentsScanned: int
+    numberOfMetadataDocumentsScanned: int
+    numberOfNewDocumentsIndexed: int
+    numberOfModifiedDocumentsIndexed: int
+    numberOfMetadataDocumentsModified: int
+    numberOfDocumentsDeleted: int
+    numberOfDocumentsFailed: int
+
+
 class IngestionJobResponseDict(TypedDict):
     """取り込みジョブのレスポンス型"""
     ingestion_job_id: str
     status: str
-    statistics: Optional[Dict[str, Any]]
+    statistics: Optional[IngestionJobStatisticsDict]
+
+
+class IngestionJobWaitResponseDict(IngestionJobResponseDict):
+    """取り込みジョブの完了待ちのレスポンス型"""
+    timed_out: bool
+    elapsed_seconds: float
+
+
+class RetrieveResultDict(TypedDict, total=False):
+    """RAGクエリの検索結果1件の型（AWS APIのKnowledgeBaseRetrievalResultと同じキー）"""
+    content: Dict[str, Any]
+    location: Dict[str, Any]
+    score: float
+    metadata: Dict[str, Any]
 
 
 class RetrieveResponseDict(TypedDict):
     """RAGクエリのレスポンス型"""
-    results: List[Dict[str, Any]]
+    results: List[RetrieveResultDict]
     query: str
 
 
+class BatchRetrieveResponseDict(TypedDict):
+    """複数RAGクエリのレスポンス型"""
+    count: int
+    results: List[RetrieveResponseDict]
+
+
+class CacheClearResponseDict(TypedDict):
+    """キャッシュ削除のレスポンス型"""
+    cleared: int
+    status: str
+
+
 class S3UploadResponseDict(TypedDict):
     """S3アップロードのレスポンス型"""
     s3_uri: str
@@ -67,6 +104,7 @@ class S3DocumentListResponseDict(TypedDict):
     bucket: str
     prefix: str
     documents: List[Dict[str, Any]]
+    next_token: Optional[str]
 
 
 class S3BucketCreateResponseDict(TypedDict):
@@ -85,6 +123,12 @@ class IAMRoleCreateResponseDict(TypedDict):
     status: str
 
 
+class KBInfrastructureResponseDict(TypedDict):
+    """S3バケットとIAMロールの一括作成のレスポンス型"""
+    bucket: S3BucketCreateResponseDict
+    role: IAMRoleCreateResponseDict
+
+
 class ErrorResponseDict(TypedDict):
     """エラーレスポンスの型"""
     error: str